@@ -3,6 +3,8 @@ This script is used to analyze the natal chart of a given instrument.
 It uses the swisseph library to calculate the natal chart and the transits of the planets.
 It also calculates the mercury retrograde days of the planets.
 It also calculates the aspect windows of the planets.
+It can also build a shared calendar of sky events (lunations, eclipses, sign ingresses and
+planet-to-planet aspects), cached per year in `data/sky` and reused by every instrument (--sky-events).
 
 Installation guide:
 You need to first install python 3.10 or higher.
@@ -32,9 +34,23 @@ import sys
 import pandas as pd
 import os
 import urllib.request
+import urllib.error
+import tempfile
+import contextlib
+import json
+import hashlib
+import bisect
+import itertools
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import logging
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
 # Logging setup
 logger = logging.getLogger(__name__)
 handler = logging.StreamHandler()
@@ -51,10 +67,20 @@ REQUIRED_FILES = [
     "sepl_18.se1",
     "sepl_24.se1",
 ]
-EPHE_URLS = {
-    fname: f"https://raw.githubusercontent.com/aloistr/swisseph/master/ephe/{fname}"
-    for fname in REQUIRED_FILES
-}
+MOON_FILES = [  # the Moon has its own files, one per planet segment
+    "semo_00.se1",
+    "semo_06.se1",
+    "semo_12.se1",
+    "semo_18.se1",
+    "semo_24.se1",
+]
+EPHE_BASE_URL         = "https://raw.githubusercontent.com/aloistr/swisseph/master/ephe"
+EPHE_SEGMENT_YEARS    = 600                # each sepl_NN/semo_NN.se1 covers years NN*100 .. NN*100+599
+EPHE_CHECKSUM_FILE    = "checksums.json"   # sha256/size of every verified file in EPHE_DIR
+EPHE_SUMS_FILE        = "SHA256SUMS"       # optional expected digests published by a mirror
+EPHE_LOCK_FILE        = ".provision.lock"
+EPHE_DOWNLOAD_WORKERS = 4
+EPHE_TIMEOUT          = 60                 # seconds per HTTP request
 
 # Aspect definitions with orbs and polarities based on astrological methodology
 ASPECTS = [
@@ -76,6 +102,17 @@ PLANETS = {
     "Neptune": swe.NEPTUNE,
 }
 
+SIGNS = [
+    "Aries","Taurus","Gemini","Cancer","Leo","Virgo",
+    "Libra","Scorpio","Sagittarius","Capricorn","Aquarius","Pisces"
+]
+
+# House systems accepted by swe.houses (one-letter codes)
+HOUSE_SYSTEMS = {
+    "P": "Placidus",     "K": "Koch",           "W": "Whole Sign", "E": "Equal",
+    "O": "Porphyry",     "R": "Regiomontanus",  "C": "Campanus",   "B": "Alcabitius",
+}
+
 SIGN_RULERS_TRADITIONAL = {
     "Aries": "Mars",   "Taurus": "Venus", "Gemini": "Mercury",  "Cancer": "Moon",
     "Leo":   "Sun",    "Virgo": "Mercury", "Libra":  "Venus",    "Scorpio":"Pluto",
@@ -96,6 +133,33 @@ SIGNIFICANCE_THRESHOLD = 3
 RULING_PLANET_BONUS   = 2.5
 RETROGRADE_BONUS      = 1.0
 
+# Intraday mode: trading sessions in the instrument's local time (HOSE by default)
+TRADING_SESSIONS      = ["09:00-11:30", "13:00-14:45"]
+INTRADAY_STEP_MINUTES = 15
+INTRADAY_PLANETS      = ["Moon", "Mercury"]  # fast enough to matter within a session
+
+# Global sky-event calendar setup
+SKY_CACHE_DIR        = os.path.join(os.getcwd(), "data", "sky")
+SKY_CALENDAR_VERSION = 1
+LUNATION_PHASES = {
+    0:   "New Moon",
+    90:  "First Quarter",
+    180: "Full Moon",
+    270: "Last Quarter",
+}
+SOLAR_ECLIPSE_TYPES = [
+    (swe.ECL_ANNULAR_TOTAL, "Hybrid"),
+    (swe.ECL_TOTAL,         "Total"),
+    (swe.ECL_ANNULAR,       "Annular"),
+    (swe.ECL_PARTIAL,       "Partial"),
+]
+LUNAR_ECLIPSE_TYPES = [
+    (swe.ECL_TOTAL,      "Total"),
+    (swe.ECL_PARTIAL,    "Partial"),
+    (swe.ECL_PENUMBRAL,  "Penumbral"),
+]
+CROSSING_ITERATIONS = 16  # bisection steps on a 1-day bracket, ~1.3s precision
+
 def load_config_file(instrument, config_file=None):    
     """
     Load instrument data from a CSV or Excel file.
@@ -152,14 +216,249 @@ def load_config_file(instrument, config_file=None):
     
     return None
 
+def ephemeris_files_for_range(start_year, end_year):
+    """
+    Return the sepl_*/semo_*.se1 files covering start_year..end_year.
+    Years outside the files (AD 0 - 2999) are clamped with a warning; swisseph
+    computes them with its built-in Moshier ephemeris instead.
+    """
+    if start_year > end_year:
+        start_year, end_year = end_year, start_year
+    last = len(REQUIRED_FILES) * EPHE_SEGMENT_YEARS - 1
+    if start_year < 0 or end_year > last:
+        logger.warning(
+            f"Years {start_year}-{end_year} extend beyond the ephemeris files (0-{last}); "
+            f"the Moshier ephemeris is used outside them."
+        )
+        start_year = min(max(start_year, 0), last)
+        end_year   = min(max(end_year, 0), last)
+    files = []
+    for seg in range(start_year // EPHE_SEGMENT_YEARS, end_year // EPHE_SEGMENT_YEARS + 1):
+        files += [REQUIRED_FILES[seg], MOON_FILES[seg]]
+    return files
+
+@contextlib.contextmanager
+def _ephemeris_lock(directory):
+    """Exclusive lock on `directory` shared by all processes; blocks until it is free."""
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, EPHE_LOCK_FILE), "a+b") as fh:
+        if fcntl:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
+        else:
+            while True:
+                try:
+                    fh.seek(0)
+                    msvcrt.locking(fh.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:  # LK_LOCK gives up after ~10s; keep waiting
+                    continue
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+            else:
+                fh.seek(0)
+                msvcrt.locking(fh.fileno(), msvcrt.LK_UNLCK, 1)
+
+def _local_source(source):
+    """The mirror directory behind `source`, or None for an HTTP(S) source."""
+    if source.startswith("file://"):
+        source = urllib.request.url2pathname(source[len("file://"):])
+    return source if os.path.isdir(source) else None
+
+def _open_ephemeris_source(source, name):
+    """
+    Open `name` from a mirror directory, file:// URL or HTTP(S) base URL.
+    Returns (readable stream, expected size or None).
+    """
+    local = _local_source(source)
+    if local:
+        path = os.path.join(local, name)
+        return open(path, "rb"), os.path.getsize(path)
+    resp = urllib.request.urlopen(f"{source.rstrip('/')}/{name}", timeout=EPHE_TIMEOUT)
+    length = resp.headers.get("Content-Length")
+    return resp, int(length) if length else None
+
+def _source_file_size(source, name):
+    """Size of `name` at the source (mirror file size or HTTP Content-Length); None if unknown."""
+    local = _local_source(source)
+    if local:
+        path = os.path.join(local, name)
+        return os.path.getsize(path) if os.path.isfile(path) else None
+    req = urllib.request.Request(f"{source.rstrip('/')}/{name}", method="HEAD")
+    try:
+        with urllib.request.urlopen(req, timeout=EPHE_TIMEOUT) as resp:
+            length = resp.headers.get("Content-Length")
+    except (OSError, urllib.error.URLError):
+        return None
+    return int(length) if length else None
+
+def _fetch_expected_checksums(source):
+    """Read the optional SHA256SUMS published next to the files; {} when there is none."""
+    try:
+        stream, _ = _open_ephemeris_source(source, EPHE_SUMS_FILE)
+        with stream:
+            text = stream.read().decode("utf-8", "replace")
+    except (OSError, urllib.error.URLError):
+        return {}
+    sums = {}
+    for line in text.splitlines():
+        parts = line.split()
+        if len(parts) == 2:
+            sums[parts[1].lstrip("*")] = parts[0].lower()
+    return sums
+
+def _is_se1_file(path, fname):
+    """Swiss Ephemeris files name themselves in their text header; HTML error pages don't."""
+    with open(path, "rb") as f:
+        return fname.encode("ascii") in f.read(512)
+
+def _sha256_file(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _download_ephemeris_file(fname, source, expected_sha=None):
+    """
+    Fetch one ephemeris file into EPHE_DIR through a temp file, verify size, header and
+    checksum, then atomically rename it into place. Returns its {size, sha256} record.
+    """
+    fd, tmp = tempfile.mkstemp(prefix=f".{fname}.", suffix=".part", dir=EPHE_DIR)
+    try:
+        digest, size = hashlib.sha256(), 0
+        try:
+            with os.fdopen(fd, "wb") as out:
+                stream, expected_size = _open_ephemeris_source(source, fname)
+                with stream:
+                    for chunk in iter(lambda: stream.read(1 << 16), b""):
+                        out.write(chunk)
+                        digest.update(chunk)
+                        size += len(chunk)
+                out.flush()
+                os.fsync(out.fileno())
+        except (OSError, urllib.error.URLError) as e:
+            raise FileNotFoundError(f"Could not fetch {fname} from {source}: {e}")
+
+        sha = digest.hexdigest()
+        if size == 0:
+            raise FileNotFoundError(f"Downloaded file is empty: {fname}")
+        if expected_size is not None and size != expected_size:
+            raise ValueError(f"Truncated download of {fname}: {size} of {expected_size} bytes")
+        if not _is_se1_file(tmp, fname):
+            raise ValueError(f"Downloaded {fname} is not a Swiss Ephemeris file")
+        if expected_sha and sha != expected_sha:
+            raise ValueError(f"Checksum mismatch for {fname}: {sha} != {expected_sha}")
+
+        os.chmod(tmp, 0o644)  # mkstemp creates owner-only files
+        os.replace(tmp, os.path.join(EPHE_DIR, fname))
+        logger.debug(f"Fetched {fname} ({size} bytes) from {source}")
+        return {"size": size, "sha256": sha}
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+def _jd_to_date_time(jd):
+    """Convert a UT Julian day into ('YYYY/MM/DD', 'HH:MM') strings, rounded to the minute."""
+    y, m, d, h = swe.revjul(jd)
+    dt = datetime.datetime(y, m, d) + datetime.timedelta(hours=h, seconds=30)
+    return dt.strftime("%Y/%m/%d"), dt.strftime("%H:%M")
+
+def _planet_longitude(jd, pid):
+    """Return (longitude, speed) of planet `pid` at UT Julian day `jd`."""
+    xx, _ = swe.calc_ut(jd, pid, swe.FLG_SPEED)
+    return xx[0], xx[3]
+
+def _longitude_track(pid, jd_start, jd_end, step=1.0):
+    """
+    Sample a planet's longitude every `step` days from jd_start through jd_end.
+    Returns (jds, lons, speeds) lists of equal length.
+    """
+    n = int((jd_end - jd_start) / step + 0.5)
+    jds = [jd_start + i * step for i in range(n + 1)]
+    lons, speeds = [], []
+    for jd in jds:
+        lon, speed = _planet_longitude(jd, pid)
+        lons.append(lon)
+        speeds.append(speed)
+    return jds, lons, speeds
+
+def _bisect_crossing(func, jd0, jd1, iterations=CROSSING_ITERATIONS):
+    """
+    Narrow down the moment the signed angle `func(jd)` changes sign
+    between jd0 and jd1. Returns the Julian day of the crossing.
+    """
+    neg0 = func(jd0) < 0
+    for _ in range(iterations):
+        mid = (jd0 + jd1) / 2
+        if (func(mid) < 0) == neg0:
+            jd0 = mid
+        else:
+            jd1 = mid
+    return (jd0 + jd1) / 2
+
+def _find_zero_crossings(jds, values, func, max_jump=90.0):
+    """
+    Locate every zero crossing of a sampled signed angle (in [-180, 180)).
+    `values` are the samples of `func` at `jds`; jumps larger than `max_jump`
+    are wrap-arounds at ±180°, not crossings. Returns refined Julian days.
+    """
+    found = []
+    for i in range(1, len(jds)):
+        v0, v1 = values[i - 1], values[i]
+        if (v0 < 0) != (v1 < 0) and abs(v1 - v0) < max_jump:
+            found.append(_bisect_crossing(func, jds[i - 1], jds[i]))
+    return found
+
+def _find_cusp_crossings(pid, jds, lons, cusps):
+    """
+    Locate every crossing of a planet's sampled longitude track over `cusps`
+    (12 sign boundaries or house cusps, in zodiacal order).
+    Returns a list of (jd, segment, retrograde) tuples, where `segment` is the
+    0-based index of the sign/house being entered.
+    """
+    n = len(cusps)
+    rel_cusps = [(c - cusps[0]) % 360 for c in cusps]
+
+    def segment(lon):
+        return bisect.bisect_right(rel_cusps, (lon - cusps[0]) % 360) - 1
+
+    crossings = []
+    prev_seg = segment(lons[0])
+    for i in range(1, len(jds)):
+        cur_seg = segment(lons[i])
+        if cur_seg != prev_seg:
+            retro = swe.difdeg2n(lons[i], lons[i - 1]) < 0
+            seg = prev_seg
+            # Walk across every boundary passed between the two samples
+            while seg != cur_seg:
+                nxt = (seg + (-1 if retro else 1)) % n
+                # Direct motion enters `nxt` at its own cusp, retrograde motion at the following one
+                cusp = cusps[seg] if retro else cusps[nxt]
+                jd = _bisect_crossing(
+                    lambda t: swe.difdeg2n(_planet_longitude(t, pid)[0], cusp),
+                    jds[i - 1], jds[i]
+                )
+                crossings.append((jd, nxt, retro))
+                seg = nxt
+        prev_seg = cur_seg
+    return crossings
+
 class FinancialAstrology:
-    _ephemeris_checked = False
+    _ephemeris_ready = set()  # files verified by this process
+    ephemeris_source = os.environ.get("NATAL_EPHE_MIRROR") or EPHE_BASE_URL
 
     def __init__(self, instrument_name, birth_date, birth_time,
-                 birth_location, lat, lon, utc_offset="+07:00"):
+                 birth_location, lat, lon, utc_offset="+07:00", house_system="P"):
         self.instrument_name = instrument_name
         self.birth_location  = birth_location        
 
+        if house_system not in HOUSE_SYSTEMS:
+            raise ValueError(f"Invalid house system: {house_system}. Use one of {', '.join(HOUSE_SYSTEMS)}.")
+        self.house_system = house_system
+
         # Parse UTC offset
         sign = 1 if utc_offset.startswith("+") else -1
         try:
@@ -189,42 +488,127 @@ class FinancialAstrology:
             self.utc_datetime.hour + self.utc_datetime.minute/60.0
         )
 
-        # Ensure ephemeris and set path
-        self._ensure_ephemeris_ready()
+        # Ensure ephemeris for the natal date and set path
+        self._ensure_ephemeris_ready(self.utc_datetime.year, self.utc_datetime.year)
         swe.set_ephe_path(EPHE_DIR)
 
         # Houses and angles
-        self._houses, self._ascmc = swe.houses(self.jd_natal, self.lat, self.lon, b"P")
+        self._houses, self._ascmc = swe.houses(
+            self.jd_natal, self.lat, self.lon, self.house_system.encode("ascii")
+        )
 
         # Natal positions & ruling planet
         self.all_natal_points    = self._get_natal_positions()
         self.ruling_planet_name  = self._get_ruling_planet()
 
     @classmethod
-    def _ephemeris_files_exist(cls):
-        for fname in REQUIRED_FILES:
-            path = os.path.join(EPHE_DIR, fname)
-            if not os.path.exists(path) or os.path.getsize(path) == 0:
-                return False
-        return True
+    def _load_ephemeris_checksums(cls):
+        try:
+            with open(os.path.join(EPHE_DIR, EPHE_CHECKSUM_FILE), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
 
     @classmethod
-    def _download_and_extract_ephemeris(cls):
-        os.makedirs(EPHE_DIR, exist_ok=True)
-        for fname, url in EPHE_URLS.items():
-            dest = os.path.join(EPHE_DIR, fname)
-            if os.path.exists(dest) and os.path.getsize(dest) > 0:
-                continue
-            urllib.request.urlretrieve(url, dest)
-            if os.path.getsize(dest) == 0:
-                raise FileNotFoundError(f"Downloaded file is empty: {fname}")
+    def _save_ephemeris_checksums(cls, checksums):
+        path = os.path.join(EPHE_DIR, EPHE_CHECKSUM_FILE)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(checksums, f, indent=2, sort_keys=True)
+        os.replace(tmp, path)
+
+    @classmethod
+    def _ephemeris_file_verified(cls, fname, checksums):
+        """A file is ready when its size and sha256 match the recorded checksum."""
+        path = os.path.join(EPHE_DIR, fname)
+        rec = checksums.get(fname)
+        return (
+            rec is not None
+            and os.path.exists(path)
+            and os.path.getsize(path) == rec["size"]
+            and _sha256_file(path) == rec["sha256"]
+        )
+
+    @classmethod
+    def _download_ephemeris(cls, files, checksums):
+        """
+        Bring `files` into EPHE_DIR, verified. Must be called under the provisioning lock.
+        Files already on disk without a checksum record (older installs, bundled copies)
+        are adopted only if they pass the header check and match the source: its published
+        checksum, or else its size. When the source can tell neither, or a recorded file
+        no longer matches, the file is fetched again.
+        If the source can't be reached, unrecorded files that pass the header check are
+        kept unverified, and a missing Moon file leaves the Moon to the Moshier ephemeris;
+        both are verified on the next run that reaches the source.
+        """
+        source   = cls.ephemeris_source
+        expected = _fetch_expected_checksums(source)
+        missing  = []
+        for fname in files:
+            path = os.path.join(EPHE_DIR, fname)
+            if (fname not in checksums and os.path.exists(path) and os.path.getsize(path) > 0
+                    and _is_se1_file(path, fname)):
+                size, sha = os.path.getsize(path), _sha256_file(path)
+                if fname in expected:
+                    adopt = expected[fname] == sha
+                else:
+                    adopt = _source_file_size(source, fname) == size
+                if adopt:
+                    checksums[fname] = {"size": size, "sha256": sha}
+                    continue
+            missing.append(fname)
+
+        errors = []
+        if missing:
+            logger.info(f"Fetching ephemeris {', '.join(missing)} from {source}")
+            with ThreadPoolExecutor(max_workers=min(len(missing), EPHE_DOWNLOAD_WORKERS)) as pool:
+                futures = {
+                    fname: pool.submit(_download_ephemeris_file, fname, source, expected.get(fname))
+                    for fname in missing
+                }
+            for fname, fut in futures.items():
+                path = os.path.join(EPHE_DIR, fname)
+                try:
+                    checksums[fname] = fut.result()
+                except FileNotFoundError as e:
+                    if (fname not in checksums and os.path.exists(path)
+                            and os.path.getsize(path) > 0 and _is_se1_file(path, fname)):
+                        logger.warning(f"{e}; using the unverified {fname} in {EPHE_DIR}")
+                    elif fname in MOON_FILES and not os.path.exists(path):
+                        logger.warning(f"{e}; the Moon falls back to the Moshier ephemeris")
+                    else:
+                        errors.append(e)
+                except ValueError as e:
+                    errors.append(e)
+        cls._save_ephemeris_checksums(checksums)
+        if errors:
+            raise errors[0]
 
     @classmethod
-    def _ensure_ephemeris_ready(cls):
-        if not cls._ephemeris_checked:
-            if not cls._ephemeris_files_exist():
-                cls._download_and_extract_ephemeris()
-            cls._ephemeris_checked = True
+    def _ensure_ephemeris_ready(cls, start_year=None, end_year=None):
+        """
+        Make sure the ephemeris files for start_year..end_year (default: this year) are in
+        EPHE_DIR and verified. Concurrent processes serialize on a file lock, so only one
+        of them downloads while the others wait and then reuse the verified files.
+        """
+        this_year = datetime.date.today().year
+        files = ephemeris_files_for_range(
+            this_year if start_year is None else start_year,
+            this_year if end_year is None else end_year,
+        )
+        pending = [f for f in files if f not in cls._ephemeris_ready]
+        if not pending:
+            return
+
+        # Fast path: checksums.json is replaced atomically, so it can be read without the lock
+        checksums = cls._load_ephemeris_checksums()
+        if not all(cls._ephemeris_file_verified(f, checksums) for f in pending):
+            with _ephemeris_lock(EPHE_DIR):
+                checksums = cls._load_ephemeris_checksums()
+                missing = [f for f in pending if not cls._ephemeris_file_verified(f, checksums)]
+                if missing:
+                    cls._download_ephemeris(missing, checksums)
+        cls._ephemeris_ready.update(pending)
 
     def _parse_lat_lon(self, coord, coord_type):
         coord = coord.strip()
@@ -263,17 +647,14 @@ class FinancialAstrology:
         return asc_r
 
     def _get_sign(self, longitude):
-        signs = [
-            "Aries","Taurus","Gemini","Cancer","Leo","Virgo",
-            "Libra","Scorpio","Sagittarius","Capricorn","Aquarius","Pisces"
-        ]
-        return signs[int(longitude // 30)]
+        return SIGNS[int(longitude // 30)]
 
 
     def find_retrograde_days(self, planet, start_date, end_date):
         """Return every date between start/end where `planet` is retrograde."""
         sd = datetime.datetime.strptime(start_date, "%Y/%m/%d")
         ed = datetime.datetime.strptime(end_date,   "%Y/%m/%d")
+        self._ensure_ephemeris_ready(sd.year, ed.year)
         one_day = datetime.timedelta(days=1)
         cur = sd
         rx_days = []
@@ -348,7 +729,10 @@ class FinancialAstrology:
                     'Peak': peak['date'],
                     'PeakOrb': peak['orb'],
                     'Score': peak['score'],
-                    'Interpretation': peak['interpretation']  # Include interpretation
+                    'Interpretation': peak['interpretation'],  # Include interpretation
+                    'Transit Planet': key[0],
+                    'Natal Point': key[1],
+                    'Aspect': key[2]
                 }
 
             for ent in items[1:]:
@@ -365,6 +749,35 @@ class FinancialAstrology:
 
         return windows
     
+    def _match_aspect(self, tp, tlon, nlon, orb_days):
+        """Return (aspect, orb difference) of the tightest aspect within orb, or (None, inf)."""
+        best, md = None, float("inf")
+        angular_separation = abs(swe.difdeg2n(tlon, nlon))
+        for asp in ASPECTS:
+            orb = asp["orb"] * PLANET_ORB_ADJUSTMENTS.get(tp, 1) * orb_days
+            orb_diff = abs(angular_separation - asp["angle"]) # Difference from the aspect's angle
+            if orb_diff <= orb:
+                if orb_diff < md: # Check if this is the tightest aspect so far
+                    best, md = asp, orb_diff # Store the aspect and its orb difference
+        return best, md
+
+    def _is_notable(self, tp, exact, is_rul, is_retrograde):
+        """Moon aspects only count when near-exact, on the ruling planet, or (Mercury) retrograde."""
+        return tp!="Moon" or exact>0.97 or is_rul or (is_retrograde and tp=="Mercury")
+
+    def _aggregate_score(self, evts):
+        """Significance score of transit events hitting the same natal point together."""
+        base_score = sum(
+            e["Exactness Score"] * (e["Polarity Score"] + 1.5)
+            * (PLANET_WEIGHTS.get(e["Transit Planet"],1.0)
+            if not (e["Transit Planet"] in ["Mercury","Venus"] and not e["Is Ruling Planet Hit"])
+            else 0.5)
+            + (RULING_PLANET_BONUS if e["Is Ruling Planet Hit"] else 0)
+            + (RETROGRADE_BONUS if e["Is Retrograde"] and e["Transit Planet"]=="Mercury" else 0)
+            for e in evts
+        )
+        return base_score * (1 + len(evts)*0.7)
+
     def calculate_transits(self, start_date, end_date, orb_days=1,
                            transit_planets=None, natal_points_filter=None):
         """
@@ -381,6 +794,7 @@ class FinancialAstrology:
             raise ValueError("Start date must be on or before end date.")
         if orb_days <= 0:
             raise ValueError("orb_days must be positive.")
+        self._ensure_ephemeris_ready(sd.year, ed.year)
 
         # Defaults
         transit_planets = transit_planets or ["Sun","Moon"]
@@ -409,15 +823,7 @@ class FinancialAstrology:
 
                 tlon, is_retrograde = planet_positions[tp][current]
                 for np_name, nlon in natal_points.items():
-                    best, md = None, float("inf")
-                    angular_separation = abs(swe.difdeg2n(tlon, nlon))
-                    for asp in ASPECTS:
-                        orb = asp["orb"] * PLANET_ORB_ADJUSTMENTS.get(tp, 1) * orb_days
-                        orb_diff = abs(angular_separation - asp["angle"]) # Difference from the aspect's angle
-                        if orb_diff <= orb:
-                            if orb_diff < md: # Check if this is the tightest aspect so far
-                                best, md = asp, orb_diff # Store the aspect and its orb difference
-
+                    best, md = self._match_aspect(tp, tlon, nlon, orb_days)
                     if best:
                         total_found += 1
                         exact = 1 - (md/(best["orb"]*PLANET_ORB_ADJUSTMENTS.get(tp,1)*orb_days))
@@ -436,7 +842,7 @@ class FinancialAstrology:
                             "Timeframe": tf,
                             "Date": current
                         }
-                        if tp!="Moon" or exact>0.97 or is_rul or (is_retrograde and tp=="Mercury"):
+                        if self._is_notable(tp, exact, is_rul, is_retrograde):
                             day_events[(current.strftime("%Y/%m/%d"), np_name)].append(evt)
             current += one_day
 
@@ -455,16 +861,7 @@ class FinancialAstrology:
                 else "Mixed"     if len(frames)>1
                 else frames.pop())
 
-            base_score = sum(
-                e["Exactness Score"] * (e["Polarity Score"] + 1.5)
-                * (PLANET_WEIGHTS.get(e["Transit Planet"],1.0)
-                if not (e["Transit Planet"] in ["Mercury","Venus"] and not e["Is Ruling Planet Hit"])
-                else 0.5)
-                + (RULING_PLANET_BONUS if e["Is Ruling Planet Hit"] else 0)
-                + (RETROGRADE_BONUS if e["Is Retrograde"] and e["Transit Planet"]=="Mercury" else 0)
-                for e in evts
-            )
-            tot_score = base_score * (1 + num*0.7)
+            tot_score = self._aggregate_score(evts)
             if abs(tot_score) >= SIGNIFICANCE_THRESHOLD:
                 # Find the tightest orb of the day's aspects
                 min_orb = min(e["Orb Degree"] for e in evts)
@@ -498,7 +895,235 @@ class FinancialAstrology:
         logger.debug(f"Filtered transit events: {len(results)}")
         return sorted(results, key=lambda x: (x["DateObj"], -x["Significance Score"]))
 
-    def prepare_outputs(self, events, retro_days, max_orb=180.0, top_n=2):
+    def find_ingresses(self, start_date, end_date, transit_planets=None, include_signs=True):
+        """
+        Find transit ingresses into the natal houses (and zodiac signs) between start/end.
+        Crossings are located on each planet's daily longitude track against the 12 natal
+        house cusps and the sign boundaries, then refined by bisection, so no per-day
+        aspect test is needed. Each event carries 'Until': the date of the planet's next
+        ingress of the same type, or end_date.
+        """
+        try:
+            sd = datetime.datetime.strptime(start_date, "%Y/%m/%d")
+            ed = datetime.datetime.strptime(end_date,   "%Y/%m/%d")
+        except ValueError:
+            raise ValueError("Dates must be 'YYYY/MM/DD'")
+        if sd > ed:
+            raise ValueError("Start date must be on or before end date.")
+        self._ensure_ephemeris_ready(sd.year, ed.year)
+
+        transit_planets = transit_planets or ["Sun","Moon"]
+        transit_planets = [p for p in transit_planets if p in PLANETS]
+
+        boundaries = [("House", list(self._houses), [f"House {i+1}" for i in range(12)])]
+        if include_signs:
+            boundaries.append(("Sign", [i * 30.0 for i in range(12)], SIGNS))
+
+        jd_start = swe.julday(sd.year, sd.month, sd.day, 0.0)
+        jd_end   = jd_start + (ed - sd).days + 1
+        events = []
+        for tp in transit_planets:
+            jds, lons, _ = _longitude_track(PLANETS[tp], jd_start, jd_end)
+            for kind, cusps, names in boundaries:
+                found = [
+                    c for c in _find_cusp_crossings(PLANETS[tp], jds, lons, cusps)
+                    if jd_start <= c[0] < jd_end
+                ]
+                for i, (jd, seg, retro) in enumerate(found):
+                    date, time = _jd_to_date_time(jd)
+                    until = _jd_to_date_time(found[i+1][0])[0] if i + 1 < len(found) else end_date
+                    events.append({
+                        "Date": date,
+                        "Time": time,
+                        "Transit Planet": tp,
+                        "Ingress Type": kind,
+                        "Target": names[seg],
+                        "Is Retrograde": retro,
+                        "Until": until,
+                    })
+
+        logger.debug(f"Ingress events found: {len(events)}")
+        return sorted(events, key=lambda e: (e["Date"], e["Time"]))
+
+    def compute_ingress_windows(self, ingress_events):
+        """
+        Turn ingress events into windows spanning the planet's stay in the house/sign.
+        Returns list of dicts: {Label, Start, End, Time, Type, Retrograde}.
+        """
+        windows = []
+        for ev in ingress_events:
+            target = ev['Target']
+            if ev['Ingress Type'] == "House":
+                target = f"natal {target}"
+            windows.append({
+                'Label':      f"{ev['Transit Planet']} → {target}{' Rx' if ev['Is Retrograde'] else ''}",
+                'Start':      ev['Date'],
+                'End':        ev['Until'],
+                'Time':       ev['Time'],
+                'Type':       ev['Ingress Type'],
+                'Retrograde': ev['Is Retrograde'],
+            })
+        return windows
+
+    def _parse_sessions(self, sessions):
+        """Parse 'HH:MM-HH:MM' session strings into (label, open_minute, close_minute) tuples."""
+        parsed = []
+        for sess in sessions:
+            m = re.match(r"^(\d{1,2}):(\d{2})-(\d{1,2}):(\d{2})$", sess.strip())
+            if not m:
+                raise ValueError(f"Invalid session: '{sess}'. Use 'HH:MM-HH:MM'.")
+            h0, m0, h1, m1 = map(int, m.groups())
+            open_min, close_min = h0*60 + m0, h1*60 + m1
+            if not (0 <= open_min < close_min <= 24*60):
+                raise ValueError(f"Invalid session: '{sess}'. Open must be before close within a day.")
+            parsed.append((f"{h0:02d}:{m0:02d}-{h1:02d}:{m1:02d}", open_min, close_min))
+        return sorted(parsed, key=lambda x: x[1])
+
+    def calculate_intraday_transits(self, start_date, end_date, sessions=None,
+                                    step_minutes=INTRADAY_STEP_MINUTES, transit_planets=None,
+                                    orb_days=1, natal_points_filter=None, weekdays_only=True):
+        """
+        Evaluate fast transits (Moon, optionally Mercury) only inside trading sessions.
+        Sessions are local exchange times ('HH:MM-HH:MM', converted with the instrument's
+        utc_offset), sampled every `step_minutes`, on weekdays only unless `weekdays_only`
+        is False (instruments trading every day, e.g. BTC). Each planet's position is computed
+        once at the session open and close and interpolated in between, instead of calling the
+        ephemeris per timestamp. Events are filtered and scored like the daily ones: Moon
+        aspects must be near-exact or hit the ruling planet, aspects hitting the same natal
+        point at the same timestamp are scored together, and only combined scores of at least
+        SIGNIFICANCE_THRESHOLD are kept. Returns one event per timestamp and natal point,
+        with local 'Timestamp' and 'Session'.
+        """
+        try:
+            sd = datetime.datetime.strptime(start_date, "%Y/%m/%d")
+            ed = datetime.datetime.strptime(end_date,   "%Y/%m/%d")
+        except ValueError:
+            raise ValueError("Dates must be 'YYYY/MM/DD'")
+
+        if sd > ed:
+            raise ValueError("Start date must be on or before end date.")
+        if orb_days <= 0:
+            raise ValueError("orb_days must be positive.")
+        if step_minutes <= 0:
+            raise ValueError("step_minutes must be positive.")
+        self._ensure_ephemeris_ready(sd.year, ed.year)
+
+        sessions = self._parse_sessions(sessions or TRADING_SESSIONS)
+        transit_planets = transit_planets or ["Moon"]
+        transit_planets = [p for p in transit_planets if p in PLANETS]
+        natal_points = (
+            self.all_natal_points
+            if natal_points_filter is None
+            else {k:self.all_natal_points[k] for k in natal_points_filter}
+        )
+
+        stamp_events = defaultdict(list)
+        current      = sd
+        one_day      = datetime.timedelta(days=1)
+
+        while current <= ed:
+            if weekdays_only and current.weekday() >= 5:
+                current += one_day
+                continue
+            for label, open_min, close_min in sessions:
+                ut_open = current + datetime.timedelta(minutes=open_min, hours=-self.utc_offset)
+                jd_open = swe.julday(ut_open.year, ut_open.month, ut_open.day,
+                                     ut_open.hour + ut_open.minute/60.0)
+                span    = close_min - open_min
+                for tp in transit_planets:
+                    # Bulk per session: two ephemeris calls, linear in between
+                    lon0, speed = _planet_longitude(jd_open, PLANETS[tp])
+                    lon1, _     = _planet_longitude(jd_open + span/1440.0, PLANETS[tp])
+                    travel      = swe.difdeg2n(lon1, lon0)
+                    is_retrograde = speed < 0
+
+                    for minute in range(open_min, close_min + 1, step_minutes):
+                        tlon = (lon0 + travel * (minute - open_min) / span) % 360
+                        stamp = current + datetime.timedelta(minutes=minute)
+                        for np_name, nlon in natal_points.items():
+                            best, md = self._match_aspect(tp, tlon, nlon, orb_days)
+                            if not best:
+                                continue
+                            exact = 1 - (md/(best["orb"]*PLANET_ORB_ADJUSTMENTS.get(tp,1)*orb_days))
+                            is_rul = (np_name == self.ruling_planet_name)
+                            if not self._is_notable(tp, exact, is_rul, is_retrograde):
+                                continue
+                            key = (stamp.strftime("%Y/%m/%d %H:%M"), label, np_name)
+                            stamp_events[key].append({
+                                "Transit Planet": tp,
+                                "Aspect": best["name"],
+                                "Orb Degree": round(md,2),
+                                "Exactness Score": round(exact,2),
+                                "Polarity Score": best["polarity"],
+                                "Is Ruling Planet Hit": is_rul,
+                                "Is Retrograde": is_retrograde,
+                                "Interpretation": best["interpretation"],
+                            })
+            current += one_day
+
+        logger.debug(f"Raw intraday transit events found: {sum(map(len, stamp_events.values()))}")
+
+        # Aggregate per timestamp and natal point, score, and filter like the daily events
+        events = []
+        for (stamp, label, np_name), evts in stamp_events.items():
+            tot_score = self._aggregate_score(evts)
+            if abs(tot_score) < SIGNIFICANCE_THRESHOLD:
+                continue
+            tight = min(evts, key=lambda x: x["Orb Degree"])
+            events.append({
+                "Timestamp": stamp,
+                "Date": stamp[:10],
+                "Session": label,
+                "Natal Point": np_name,
+                "Number of Transits": len(evts),
+                "Is Ruling Planet Hit": any(e["Is Ruling Planet Hit"] for e in evts),
+                "Mercury Retrograde": any(
+                    e["Is Retrograde"] and e["Transit Planet"]=="Mercury" for e in evts
+                ),
+                "Significance Score": round(tot_score, 2),
+                "Orb Degree": tight["Orb Degree"],
+                "Transit Planet": tight["Transit Planet"],
+                "Aspect": tight["Aspect"],
+                "Transits": "; ".join(
+                    f"{e['Transit Planet']} {e['Aspect']}{' Rx' if e['Is Retrograde'] else ''}"
+                    f" (Orb {e['Orb Degree']}°)"
+                    for e in sorted(evts, key=lambda x: x["Orb Degree"])
+                ),
+                "Interpretation": tight["Interpretation"],
+            })
+
+        logger.debug(f"Filtered intraday transit events: {len(events)}")
+        return sorted(events, key=lambda x: (x["Timestamp"], -x["Significance Score"]))
+
+    def compute_intraday_windows(self, intraday_events):
+        """
+        Collapse intraday events into one window per aspect and session.
+        Returns list of dicts: {Label, Date, Session, Start, End, Peak, PeakOrb, Score, Interpretation},
+        where Start/End/Peak are local 'HH:MM' times within the session.
+        """
+        groups = defaultdict(list)
+        for ev in intraday_events:
+            key = (ev['Date'], ev['Session'], ev['Transit Planet'], ev['Natal Point'], ev['Aspect'])
+            groups[key].append(ev)
+
+        windows = []
+        for (date, session, tp, np_name, aspect), items in groups.items():
+            items = sorted(items, key=lambda x: x['Timestamp'])
+            peak  = min(items, key=lambda x: x['Orb Degree'])
+            windows.append({
+                'Label': f"{tp} → {np_name} {aspect}",
+                'Date': date,
+                'Session': session,
+                'Start': items[0]['Timestamp'][-5:],
+                'End': items[-1]['Timestamp'][-5:],
+                'Peak': peak['Timestamp'][-5:],
+                'PeakOrb': peak['Orb Degree'],
+                'Score': peak['Significance Score'],
+                'Interpretation': peak['Interpretation'],
+            })
+        return sorted(windows, key=lambda w: (w['Date'], w['Start'], -w['Score']))
+
+    def prepare_outputs(self, events, retro_days, max_orb=180.0, top_n=2, ingress_events=None):
         # 1) Filter events
         filtered = [e for e in events if e['Orb Degree'] <= max_orb]
         # 2) Group daily_events
@@ -511,7 +1136,8 @@ class FinancialAstrology:
         # 3) windows
         retro_windows   = self.compute_retro_windows(retro_days)
         aspect_windows  = self.compute_aspect_windows(daily_events)
-        return daily_events, aspect_windows, retro_windows
+        ingress_windows = self.compute_ingress_windows(ingress_events or [])
+        return daily_events, aspect_windows, retro_windows, ingress_windows
     
     
     def display_natal_chart(self):
@@ -520,6 +1146,7 @@ class FinancialAstrology:
         print(f"Born: {self.birth_datetime:%Y-%m-%d %H:%M}"
               f" at {self.lat:.4f},{self.lon:.4f} (UTC{self.utc_offset:+.2f})")
         print(f"Ruling Planet: {self.ruling_planet_name}")        
+        print(f"House System: {HOUSE_SYSTEMS[self.house_system]}")
         print("-"*40)
         for name, deg in self.all_natal_points.items():
             if name in ("Ascendant","Midheaven","Sun","Moon",
@@ -576,13 +1203,15 @@ class FinancialAstrology:
                         f" @ orb {entry['orb']}° (score {entry['score']})"
                     )
 
-    def display_transits(self, retro_windows, aspect_windows):
+    def display_transits(self, retro_windows, aspect_windows, ingress_windows=None):
         """
         Print a unified, chronological list of:
         • Mercury Retrograde windows
         • Collapsed aspect windows with interpretations
+        • House/sign ingress windows
         retro_windows: list of dicts with keys 'start','end','peak'
         aspect_windows: list of dicts with keys 'Label','Start','Peak','End','PeakOrb','Score','Interpretation'
+        ingress_windows: list of dicts with keys 'Label','Start','End','Time','Type'
         """
         import datetime
 
@@ -604,7 +1233,16 @@ class FinancialAstrology:
                 'label':    w['Label'],
                 'peak_orb': w['PeakOrb'],
                 'score':    w['Score'],
-                'interpretation': w['Interpretation']
+                'interpretation': w['Interpretation'],
+                'sky':      w.get('Sky Events', [])
+            })
+        for w in ingress_windows or []:
+            items.append({
+                'type':  'ingress',
+                'start': w['Start'],
+                'end':   w['End'],
+                'label': w['Label'],
+                'time':  w['Time']
             })
 
         # 2) sort by start date
@@ -616,12 +1254,32 @@ class FinancialAstrology:
             if it['type'] == 'retro':
                 # This line can also be updated for consistency if you like
                 print(f"  • {it['start']} – {it['end']}: Mercury Retrograde (peak {it['peak']})")
+            elif it['type'] == 'ingress':
+                print(f"  • {it['start']} – {it['end']}: {it['label']} (ingress {it['time']} UT)")
             else:
                 # The key change is here:
                 print(
                     f"  • {it['start']} – {it['end']}: {it['label']}"
                     f" (peak {it['peak']} @ orb {it['peak_orb']}°, score {it['score']}; {it['interpretation']})"
                 )
+                if it['sky']:
+                    print(f"      sky: {'; '.join(it['sky'])}")
+
+    def display_intraday_windows(self, intraday_windows):
+        """
+        Print intraday aspect windows grouped by trading day and session.
+        intraday_windows: list of dicts from compute_intraday_windows
+        """
+        print(f"\nINTRADAY SESSION WINDOWS FOR {self.instrument_name.upper()} (UTC{self.utc_offset:+.2f})")
+        last = None
+        for w in intraday_windows:
+            if (w['Date'], w['Session']) != last:
+                last = (w['Date'], w['Session'])
+                print(f"\n{w['Date']} session {w['Session']}:")
+            print(
+                f"  • {w['Start']} – {w['End']}: {w['Label']}"
+                f" (peak {w['Peak']} @ orb {w['PeakOrb']}°, score {w['Score']}; {w['Interpretation']})"
+            )
 
     def summarize_aspect_windows(self, events):
         """
@@ -665,6 +1323,187 @@ class FinancialAstrology:
 
         return summary
 
+class SkyCalendar:
+    """
+    Instrument-independent sky events: lunations, eclipses, sign ingresses and
+    transit-to-transit aspects among `PLANETS`. Events are computed once per
+    calendar year, cached on disk under `cache_dir`, and joined onto any
+    instrument's transit results by date.
+    """
+
+    def __init__(self, cache_dir=SKY_CACHE_DIR, planets=None):
+        self.cache_dir = cache_dir
+        self.planets   = {name: PLANETS[name] for name in (planets or PLANETS) if name in PLANETS}
+        self._years    = {}
+
+        # Cache files are keyed by everything that changes their content
+        signature = json.dumps({
+            "version": SKY_CALENDAR_VERSION,
+            "planets": sorted(self.planets),
+            "aspects": sorted(a["angle"] for a in ASPECTS),
+        }, sort_keys=True)
+        self.signature = hashlib.sha1(signature.encode("utf-8")).hexdigest()[:10]
+
+    def _cache_path(self, year):
+        return os.path.join(self.cache_dir, f"sky_{year}_{self.signature}.json")
+
+    def events_for_year(self, year):
+        """Return all sky events of a UT calendar year, computing and caching them on first use."""
+        if year in self._years:
+            return self._years[year]
+
+        path = self._cache_path(year)
+        if os.path.exists(path):
+            try:
+                with open(path, encoding="utf-8") as f:
+                    self._years[year] = json.load(f)
+                logger.debug(f"Loaded sky events for {year} from {path}")
+                return self._years[year]
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable sky cache {path}: {e}")
+
+        FinancialAstrology._ensure_ephemeris_ready(year, year)
+        swe.set_ephe_path(EPHE_DIR)
+        events = self._compute_year(year)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(events, f, ensure_ascii=False)
+        os.replace(tmp, path)
+        logger.debug(f"Cached {len(events)} sky events for {year} in {path}")
+
+        self._years[year] = events
+        return events
+
+    def events_between(self, start_date, end_date):
+        """Return the sky events dated between start_date and end_date ('YYYY/MM/DD'), inclusive."""
+        try:
+            sd = datetime.datetime.strptime(start_date, "%Y/%m/%d")
+            ed = datetime.datetime.strptime(end_date,   "%Y/%m/%d")
+        except ValueError:
+            raise ValueError("Dates must be 'YYYY/MM/DD'")
+
+        events = []
+        for year in range(sd.year, ed.year + 1):
+            events.extend(
+                e for e in self.events_for_year(year)
+                if start_date <= e["Date"] <= end_date
+            )
+        return sorted(events, key=lambda e: (e["Date"], e["Time"]))
+
+    def annotate(self, records, date_key="Date"):
+        """
+        Join sky events onto instrument results by date. Each record (a transit
+        event, or a window when `date_key` is e.g. 'Peak') gains a 'Sky Events'
+        list with the labels of the sky events on that date.
+        """
+        if not records:
+            return records
+        dates = [r[date_key] for r in records]
+        by_date = defaultdict(list)
+        for e in self.events_between(min(dates), max(dates)):
+            by_date[e["Date"]].append(e["Label"])
+        for r in records:
+            r["Sky Events"] = by_date.get(r[date_key], [])
+        return records
+
+    def _compute_year(self, year):
+        jd_start = swe.julday(year, 1, 1, 0.0)
+        jd_end   = swe.julday(year + 1, 1, 1, 0.0)
+        tracks = {
+            name: _longitude_track(pid, jd_start, jd_end)
+            for name, pid in self.planets.items()
+        }
+
+        events  = self._find_lunations(tracks, jd_start, jd_end)
+        events += self._find_eclipses(jd_start, jd_end)
+        events += self._find_ingresses(tracks)
+        events += self._find_mutual_aspects(tracks)
+
+        # Keep each crossing in exactly one year
+        events = [e for e in events if jd_start <= e.pop("JD") < jd_end]
+        logger.debug(f"Computed {len(events)} sky events for {year}")
+        return sorted(events, key=lambda e: (e["Date"], e["Time"]))
+
+    def _event(self, jd, kind, label, planets, **extra):
+        date, time = _jd_to_date_time(jd)
+        return {"Date": date, "Time": time, "JD": jd, "Type": kind,
+                "Label": label, "Planets": planets, **extra}
+
+    def _find_lunations(self, tracks, jd_start, jd_end):
+        # Reuse the Sun and Moon tracks unless the calendar doesn't follow them
+        jds, sun, _  = tracks.get("Sun")  or _longitude_track(swe.SUN,  jd_start, jd_end)
+        _,   moon, _ = tracks.get("Moon") or _longitude_track(swe.MOON, jd_start, jd_end)
+        events = []
+        for phase, name in LUNATION_PHASES.items():
+            values = [swe.difdeg2n(m - s, phase) for m, s in zip(moon, sun)]
+            func = lambda t, phase=phase: swe.difdeg2n(
+                _planet_longitude(t, swe.MOON)[0] - _planet_longitude(t, swe.SUN)[0], phase
+            )
+            for jd in _find_zero_crossings(jds, values, func):
+                sign = SIGNS[int(_planet_longitude(jd, swe.MOON)[0] // 30)]
+                events.append(self._event(jd, "Lunation", f"{name} in {sign}", ["Sun", "Moon"],
+                                          Sign=sign))
+        return events
+
+    def _find_eclipses(self, jd_start, jd_end):
+        events = []
+        searches = [
+            ("Solar", swe.sol_eclipse_when_glob, SOLAR_ECLIPSE_TYPES, swe.SUN),
+            ("Lunar", swe.lun_eclipse_when,      LUNAR_ECLIPSE_TYPES, swe.MOON),
+        ]
+        for kind, search, types, pid in searches:
+            jd = jd_start
+            while True:
+                retflag, tret = search(jd, swe.FLG_SWIEPH)
+                jd_max = tret[0]
+                if jd_max >= jd_end:
+                    break
+                ecl_type = next((name for flag, name in types if retflag & flag), "Partial")
+                sign = SIGNS[int(_planet_longitude(jd_max, pid)[0] // 30)]
+                events.append(self._event(jd_max, "Eclipse", f"{ecl_type} {kind} Eclipse in {sign}",
+                                          ["Sun", "Moon"], Sign=sign))
+                jd = jd_max + 1
+        return events
+
+    def _find_ingresses(self, tracks):
+        events = []
+        sign_cusps = [i * 30.0 for i in range(12)]
+        for name, (jds, lons, _) in tracks.items():
+            for jd, seg, retro in _find_cusp_crossings(self.planets[name], jds, lons, sign_cusps):
+                label = f"{name} enters {SIGNS[seg]}{' Rx' if retro else ''}"
+                events.append(self._event(jd, "Ingress", label, [name],
+                                          Sign=SIGNS[seg], Retrograde=retro))
+        return events
+
+    def _find_mutual_aspects(self, tracks):
+        events = []
+        for p1, p2 in itertools.combinations(self.planets, 2):
+            # Sun-Moon aspects are reported as lunations
+            if {p1, p2} == {"Sun", "Moon"}:
+                continue
+            jds, lons1, _ = tracks[p1]
+            _,   lons2, _ = tracks[p2]
+            pid1, pid2 = self.planets[p1], self.planets[p2]
+            for asp in ASPECTS:
+                # Waxing and waning sides of the same aspect (e.g. 90° and 270°)
+                for target in sorted({asp["angle"] % 360, -asp["angle"] % 360}):
+                    values = [swe.difdeg2n(a - b, target) for a, b in zip(lons1, lons2)]
+                    func = lambda t, target=target: swe.difdeg2n(
+                        _planet_longitude(t, pid1)[0] - _planet_longitude(t, pid2)[0], target
+                    )
+                    for jd in _find_zero_crossings(jds, values, func):
+                        events.append(self._event(jd, "Aspect", f"{p1} {asp['name']} {p2}", [p1, p2],
+                                                  Aspect=asp["name"]))
+        return events
+
+    @staticmethod
+    def display(sky_events, title="SKY EVENTS"):
+        """Print sky events in chronological order (times in UT)."""
+        print(f"\n{title}")
+        for e in sky_events:
+            print(f"  • {e['Date']} {e['Time']} UT: {e['Label']}")
+
 def main():
     parser = argparse.ArgumentParser(
         description="""
@@ -708,6 +1547,13 @@ The script outputs:
 1. **Natal Chart**: Details of the market's astrological birth, including positions of key points and planets.
 2. **Unified Window Summary**: Merged transit windows (e.g., Sun → Neptune Conjunction) and Mercury retrograde periods, with start/end dates,
    peak date (smallest orb), orb degree, and significance score.
+3. **Ingress Windows** (with --ingresses): Periods a transiting planet spends in each natal house (per --house-system)
+   and zodiac sign, starting at the exact ingress time.
+4. **Intraday Session Windows** (with --intraday): Moon (and optionally Mercury) aspects evaluated every --intraday-step
+   minutes inside the --sessions trading hours (local time, weekdays unless --include-weekends), with the session
+   and local time of the peak.
+5. **Sky Events** (with --sky-events): Lunations, eclipses, sign ingresses and planet-to-planet aspects shared by every instrument,
+   computed once per year and cached under data/sky.
 """,
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
@@ -729,6 +1575,25 @@ The script outputs:
         "Ascendant","Midheaven","Sun","Moon","Mercury","Jupiter","Neptune"
     ], help="Natal points to include")    
     parser.add_argument("--config-file", default=None, help="Path to config file (CSV or Excel)")
+    parser.add_argument("--intraday", action="store_true",
+                        help="Also evaluate fast transits within trading sessions (local time via --utc-offset)")
+    parser.add_argument("--sessions", nargs="*", default=TRADING_SESSIONS,
+                        help="Trading sessions in local time (e.g., 09:00-11:30 13:00-14:45)")
+    parser.add_argument("--intraday-step", type=int, default=INTRADAY_STEP_MINUTES,
+                        help="Intraday sampling step in minutes")
+    parser.add_argument("--intraday-planets", nargs="*", default=["Moon"], choices=INTRADAY_PLANETS,
+                        help="Transiting planets evaluated intraday (Moon, Mercury)")
+    parser.add_argument("--include-weekends", action="store_true",
+                        help="Also evaluate weekend sessions (for instruments trading every day, e.g. BTC)")
+    parser.add_argument("--house-system", default="P", choices=list(HOUSE_SYSTEMS),
+                        help="House system code (P=Placidus, K=Koch, W=Whole Sign, E=Equal, ...)")
+    parser.add_argument("--ingresses", action="store_true",
+                        help="Include transit ingresses into natal houses and zodiac signs")
+    parser.add_argument("--sky-events", action="store_true",
+                        help="Show global sky events (lunations, eclipses, ingresses, mutual aspects) and join them onto windows")
+    parser.add_argument("--sky-cache-dir", default=SKY_CACHE_DIR, help="Directory for cached yearly sky events")
+    parser.add_argument("--ephe-mirror", default=None,
+                        help="Ephemeris mirror: local directory or base URL (default: $NATAL_EPHE_MIRROR or GitHub)")
     parser.add_argument("--verbose", action="store_true", help="Enable verbose logging")
 
     args = parser.parse_args()
@@ -736,6 +1601,8 @@ The script outputs:
     # Enable DEBUG logging if --verbose is specified
     if args.verbose:
         logger.setLevel(logging.DEBUG)
+    if args.ephe_mirror:
+        FinancialAstrology.ephemeris_source = args.ephe_mirror
         
     try:        
         # Use config file values if available, otherwise fall back to arguments or defaults
@@ -769,7 +1636,8 @@ The script outputs:
             birth_location    = birth_location,
             lat               = lat,
             lon               = lon,
-            utc_offset        = utc_offset            
+            utc_offset        = utc_offset,
+            house_system      = args.house_system
         )
         
         print(f"\nANALYSIS FOR {instrument}")
@@ -791,10 +1659,39 @@ The script outputs:
             end_date
         )
         
-        daily_events, aspect_windows, retro_windows = fa.prepare_outputs(events, rx_days, max_orb=args.orb_days, top_n=args.top_n)
+        # House and sign ingresses of the transiting planets
+        ingress_events = None
+        if args.ingresses:
+            ingress_events = fa.find_ingresses(start_date, end_date, transit_planets=args.transit_planets)
+
+        daily_events, aspect_windows, retro_windows, ingress_windows = fa.prepare_outputs(
+            events, rx_days, max_orb=args.orb_days, top_n=args.top_n, ingress_events=ingress_events
+        )
+
+        # Shared sky-wide events, joined onto the windows by peak date
+        if args.sky_events:
+            sky = SkyCalendar(cache_dir=args.sky_cache_dir)
+            sky.annotate(aspect_windows, date_key="Peak")
 
         # Unified daily output with retrograde + top aspects
-        fa.display_transits(retro_windows, aspect_windows)
+        fa.display_transits(retro_windows, aspect_windows, ingress_windows)
+
+        if args.sky_events:
+            SkyCalendar.display(sky.events_between(start_date, end_date))
+
+        # Session-level timing of fast transits
+        if args.intraday:
+            intraday_events = fa.calculate_intraday_transits(
+                start_date          = start_date,
+                end_date            = end_date,
+                sessions            = args.sessions,
+                step_minutes        = args.intraday_step,
+                transit_planets     = args.intraday_planets,
+                orb_days            = args.orb_days,
+                natal_points_filter = args.filter,
+                weekdays_only       = not args.include_weekends,
+            )
+            fa.display_intraday_windows(fa.compute_intraday_windows(intraday_events))
 
     except (ValueError, FileNotFoundError) as e:
         logger.error(e)
@@ -0,0 +1,318 @@
+"""
+This script backtests the transit events and aspect windows of `analyze_natal.py`
+against local price history.
+It aligns every scored event (and window peak) to the next trading day with an as-of join,
+computes forward returns and forward volatility over configurable horizons, and groups
+the results by aspect, transit planet, natal point and score bucket.
+All alignment and aggregation is done with vectorized pandas joins and groupbys.
+
+Installation guide:
+pip install swisseph pandas
+(pip install pyarrow to read Parquet price files)
+
+Price files:
+Put one OHLC file per instrument in `data/prices`, named after the instrument
+(e.g. `VNINDEX.csv` or `VNINDEX.parquet`), with at least `date` and `close` columns
+(`open`, `high`, `low` are optional, column names are case-insensitive).
+Birth data for each instrument is read from the same config file as `analyze_natal.py`.
+
+Usage:
+python backtest_natal.py --instruments VNINDEX VN30 --start-date 2000/01/01 --end-date 2024/12/31 --horizons 1 5 10 20 --transit-planets Sun Moon --output backtest.csv
+
+For more details, you can run the help command:
+python backtest_natal.py --help
+"""
+
+import argparse
+import os
+import sys
+import logging
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from analyze_natal import FinancialAstrology, load_config_file, logger
+
+PRICES_DIR       = os.path.join(os.getcwd(), "data", "prices")
+DEFAULT_HORIZONS = [1, 5, 10, 20]
+DEFAULT_SCORE_BINS = [0, 4, 6, 8, 10, float("inf")]
+GROUP_COLUMNS    = ["Aspect", "Transit Planet", "Natal Point", "Score Bucket"]
+ASOF_TOLERANCE   = pd.Timedelta(days=7)  # never map an event further than this to a trading day
+
+
+def load_price_history(instrument, prices_dir=PRICES_DIR):
+    """
+    Load the OHLC history of `instrument` from `<prices_dir>/<instrument>.csv|.parquet`.
+    Returns a DataFrame with a datetime `date` column and lower-case price columns,
+    sorted by date.
+    """
+    candidates = {}
+    if os.path.isdir(prices_dir):
+        for fname in os.listdir(prices_dir):
+            stem, ext = os.path.splitext(fname)
+            if stem.upper() == instrument.upper() and ext.lower() in (".csv", ".parquet"):
+                candidates[ext.lower()] = os.path.join(prices_dir, fname)
+    if not candidates:
+        raise FileNotFoundError(f"No price file for {instrument} in {prices_dir}")
+
+    if ".parquet" in candidates:
+        df = pd.read_parquet(candidates[".parquet"])
+    else:
+        df = pd.read_csv(candidates[".csv"])
+
+    df.columns = [str(c).strip().lower() for c in df.columns]
+    if "date" not in df.columns or "close" not in df.columns:
+        raise ValueError(f"Price file for {instrument} needs 'date' and 'close' columns")
+
+    df["date"] = pd.to_datetime(df["date"])
+    df = df.dropna(subset=["close"]).drop_duplicates("date", keep="last")
+    return df.sort_values("date").reset_index(drop=True)
+
+
+def compute_forward_metrics(prices, horizons):
+    """
+    Add forward return `fwd_ret_<h>` (close-to-close) and forward realized volatility
+    `fwd_vol_<h>` (root mean square of the next h daily log returns) for every horizon h.
+    """
+    out = prices[["date", "close"]].copy()
+    sq_ret = np.log(out["close"]).diff().pow(2)
+    for h in horizons:
+        out[f"fwd_ret_{h}"] = out["close"].shift(-h) / out["close"] - 1
+        # rolling(h) at t+h covers returns t+1..t+h; shift it back onto t
+        out[f"fwd_vol_{h}"] = sq_ret.rolling(h).mean().pow(0.5).shift(-h)
+    return out
+
+
+def events_frame(events):
+    """Scored daily events from `calculate_transits` as a DataFrame keyed by date."""
+    df = pd.DataFrame(events, columns=[
+        "DateObj", "Natal Point", "Transit Planet", "Aspect",
+        "Significance Score", "Orb Degree",
+    ])
+    # An empty list would leave DateObj as object dtype, which merge_asof rejects
+    df["DateObj"] = pd.to_datetime(df["DateObj"])
+    return df.rename(columns={"DateObj": "Date", "Significance Score": "Score"})
+
+
+def windows_frame(aspect_windows, anchor="Peak"):
+    """Aspect windows from `prepare_outputs`, dated by their `anchor` day (Peak or Start)."""
+    df = pd.DataFrame(aspect_windows, columns=[
+        anchor, "Natal Point", "Transit Planet", "Aspect", "Score", "PeakOrb",
+    ])
+    df[anchor] = pd.to_datetime(df[anchor], format="%Y/%m/%d")
+    return df.rename(columns={anchor: "Date", "PeakOrb": "Orb Degree"})
+
+
+def compute_instrument_events(instrument, config_file, start_date, end_date,
+                              orb_days, transit_planets, natal_points, top_n, anchor):
+    """
+    Run the natal analysis for one instrument and return (events_df, windows_df).
+    Kept at module level so it can run in worker processes.
+    """
+    config = load_config_file(instrument.upper(), config_file)
+    if not config:
+        raise ValueError(f"No birth data for {instrument} in config file")
+
+    fa = FinancialAstrology(
+        instrument_name = instrument.upper(),
+        birth_date      = str(config["birth_date"]),
+        birth_time      = str(config["birth_time"]),
+        birth_location  = str(config["birth_location"]),
+        lat             = str(config["lat"]),
+        lon             = str(config["lon"]),
+        utc_offset      = str(config["utc_offset"]),
+    )
+    events = fa.calculate_transits(
+        start_date          = start_date,
+        end_date            = end_date,
+        orb_days            = orb_days,
+        transit_planets     = transit_planets,
+        natal_points_filter = natal_points,
+    )
+    _, aspect_windows, _, _ = fa.prepare_outputs(events, [], max_orb=orb_days, top_n=top_n)
+
+    ev_df = events_frame(events)
+    win_df = windows_frame(aspect_windows, anchor)
+    ev_df["Instrument"] = win_df["Instrument"] = instrument.upper()
+    return ev_df, win_df
+
+
+def align_to_trading_days(records, metrics):
+    """
+    As-of join records onto the next available trading day of the same instrument.
+    Both frames need `Instrument`; records are keyed by `Date`, metrics by `date`.
+    """
+    records = records.sort_values("Date")
+    metrics = metrics.sort_values("date")
+    joined = pd.merge_asof(
+        records, metrics,
+        left_on="Date", right_on="date", by="Instrument",
+        direction="forward", tolerance=ASOF_TOLERANCE,
+    )
+    return joined.dropna(subset=["date"]).rename(columns={"date": "Trading Date"})
+
+
+def summarize(joined, baselines, horizons, score_bins, group_columns=GROUP_COLUMNS):
+    """
+    Group aligned records by each of `group_columns` and report, per horizon:
+    count, mean/median forward return, hit rate, mean forward volatility, and
+    excess return / volatility ratio against each instrument's unconditional baseline.
+    """
+    joined = joined.copy()
+    joined["Score Bucket"] = pd.cut(joined["Score"], bins=score_bins, include_lowest=True)
+    joined = joined.merge(baselines, on="Instrument", how="left")
+
+    frames = []
+    for h in horizons:
+        ret, vol = f"fwd_ret_{h}", f"fwd_vol_{h}"
+        joined[f"hit_{h}"]    = joined[ret].gt(0).astype(float).where(joined[ret].notna())
+        joined[f"excess_{h}"] = joined[ret] - joined[f"base_ret_{h}"]
+        joined[f"vratio_{h}"] = joined[vol] / joined[f"base_vol_{h}"]
+
+        for col in group_columns:
+            g = joined.groupby(col, observed=True)
+            stats = pd.DataFrame({
+                "Count":            g[ret].count(),
+                "Mean Return":      g[ret].mean(),
+                "Median Return":    g[ret].median(),
+                "Hit Rate":         g[f"hit_{h}"].mean(),
+                "Mean Volatility":  g[vol].mean(),
+                "Excess Return":    g[f"excess_{h}"].mean(),
+                "Volatility Ratio": g[f"vratio_{h}"].mean(),
+            })
+            stats.index = stats.index.astype(str)
+            stats = stats.rename_axis("Value").reset_index()
+            stats.insert(0, "Horizon", h)
+            stats.insert(0, "Group", col)
+            frames.append(stats)
+
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, ignore_index=True)
+
+
+def backtest(instruments, start_date, end_date, horizons=DEFAULT_HORIZONS,
+             score_bins=DEFAULT_SCORE_BINS, prices_dir=PRICES_DIR, config_file=None,
+             orb_days=2, transit_planets=None, natal_points=None, top_n=3,
+             anchor="Peak", workers=1):
+    """
+    Backtest events and windows of every instrument against its price history.
+    Returns a DataFrame with one row per (Level, Group, Value, Horizon), where Level
+    is 'Event' (scored daily events) or 'Window' (aspect windows at their anchor day).
+    """
+    transit_planets = transit_planets or ["Sun", "Moon"]
+    args = [
+        (inst, config_file, start_date, end_date, orb_days,
+         transit_planets, natal_points, top_n, anchor)
+        for inst in instruments
+    ]
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(compute_instrument_events, *zip(*args)))
+    else:
+        results = [compute_instrument_events(*a) for a in args]
+
+    # Forward metrics and unconditional baselines per instrument
+    sd = pd.to_datetime(start_date, format="%Y/%m/%d")
+    ed = pd.to_datetime(end_date,   format="%Y/%m/%d")
+    metrics = []
+    for inst in instruments:
+        m = compute_forward_metrics(load_price_history(inst, prices_dir), horizons)
+        m["Instrument"] = inst.upper()
+        metrics.append(m[(m["date"] >= sd) & (m["date"] <= ed)])
+    metrics = pd.concat(metrics, ignore_index=True)
+
+    base_cols = {}
+    for h in horizons:
+        base_cols[f"base_ret_{h}"] = (f"fwd_ret_{h}", "mean")
+        base_cols[f"base_vol_{h}"] = (f"fwd_vol_{h}", "mean")
+    baselines = metrics.groupby("Instrument").agg(**base_cols).reset_index()
+
+    levels = {"Event": [r[0] for r in results], "Window": [r[1] for r in results]}
+    frames = []
+    for level, parts in levels.items():
+        parts = [p for p in parts if not p.empty]
+        if not parts:
+            logger.warning(f"{level}: no records to backtest")
+            continue
+        records = pd.concat(parts, ignore_index=True)
+        joined = align_to_trading_days(records, metrics)
+        logger.debug(f"{level}: {len(joined)} of {len(records)} records aligned to trading days")
+        summary = summarize(joined, baselines, horizons, score_bins)
+        summary.insert(0, "Level", level)
+        frames.append(summary)
+
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, ignore_index=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Backtest natal transit events and aspect windows against local price history."
+    )
+    parser.add_argument("--instruments", nargs="*", default=None,
+                        help="Instruments to backtest (default: every price file in --prices-dir)")
+    parser.add_argument("--prices-dir",  default=PRICES_DIR,   help="Directory with <instrument>.csv/.parquet OHLC files")
+    parser.add_argument("--config-file", default=None,         help="Path to config file (CSV or Excel)")
+    parser.add_argument("--start-date",  default="2000/01/01", help="Start date (YYYY/MM/DD)")
+    parser.add_argument("--end-date",    default="2024/12/31", help="End date (YYYY/MM/DD)")
+    parser.add_argument("--horizons",    nargs="*", type=int,   default=DEFAULT_HORIZONS,
+                        help="Forward horizons in trading days")
+    parser.add_argument("--score-bins",  nargs="*", type=float, default=DEFAULT_SCORE_BINS,
+                        help="Edges of the significance score buckets")
+    parser.add_argument("--anchor",      choices=["Peak", "Start"], default="Peak",
+                        help="Which window day to align windows on")
+    parser.add_argument("--orb-days",    type=int, default=2, help="Orb window in degrees/days")
+    parser.add_argument("--top-n",       type=int, default=3, help="How many hits per date to keep for windows")
+    parser.add_argument("--transit-planets", nargs="*", default=["Sun","Moon"],
+                        help="Transiting planets (e.g., Sun Moon)")
+    parser.add_argument("--filter", nargs="*", default=None, help="Natal points to include (default: all)")
+    parser.add_argument("--workers",     type=int, default=1, help="Worker processes for the transit calculations")
+    parser.add_argument("--output",      default=None, help="Write the summary to this CSV file")
+    parser.add_argument("--verbose",     action="store_true", help="Enable verbose logging")
+
+    args = parser.parse_args()
+
+    if args.verbose:
+        logger.setLevel(logging.DEBUG)
+
+    try:
+        instruments = args.instruments
+        if not instruments:
+            if not os.path.isdir(args.prices_dir):
+                raise FileNotFoundError(f"Prices directory not found: {args.prices_dir}")
+            instruments = sorted({
+                os.path.splitext(f)[0].upper() for f in os.listdir(args.prices_dir)
+                if f.lower().endswith((".csv", ".parquet"))
+            })
+
+        summary = backtest(
+            instruments     = instruments,
+            start_date      = args.start_date,
+            end_date        = args.end_date,
+            horizons        = args.horizons,
+            score_bins      = args.score_bins,
+            prices_dir      = args.prices_dir,
+            config_file     = args.config_file,
+            orb_days        = args.orb_days,
+            transit_planets = args.transit_planets,
+            natal_points    = args.filter,
+            top_n           = args.top_n,
+            anchor          = args.anchor,
+            workers         = args.workers,
+        )
+
+        if args.output:
+            summary.to_csv(args.output, index=False)
+            print(f"Backtest summary written to {args.output}")
+        with pd.option_context("display.max_rows", 200, "display.width", 200):
+            print(summary.to_string(index=False, float_format=lambda x: f"{x:.4f}"))
+
+    except (ValueError, FileNotFoundError) as e:
+        logger.error(e)
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
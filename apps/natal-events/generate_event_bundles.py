@@ -0,0 +1,234 @@
+"""
+This script precomputes static event bundles for the natal-events React app.
+For every preset instrument it uses `FinancialAstrology` (Swiss Ephemeris) to compute
+the natal chart, the scored transit events, the aspect windows and the Mercury
+retrograde windows, and writes them as compressed JSON chunks split by year,
+together with a small `manifest.json` index.
+The app can then lazy-load only the years in view, with real ephemeris accuracy
+and no transit computation in the browser.
+
+Installation guide:
+pip install swisseph pandas
+
+Output layout (default `public/data/events`, served by Vite as static files):
+    manifest.json
+    <instrument>/<year>.json.gz
+
+Windows that span a year boundary are written to every year they overlap,
+so a single loaded year always contains every window visible in it.
+
+Usage:
+python generate_event_bundles.py --start-year 2020 --end-year 2030 --instruments VNIndex BTC
+
+For more details, you can run the help command:
+python generate_event_bundles.py --help
+"""
+
+import argparse
+import datetime
+import gzip
+import json
+import os
+import sys
+import logging
+
+from analyze_natal import FinancialAstrology, HOUSE_SYSTEMS, SIGNS, logger
+
+BUNDLE_VERSION = 1
+EVENTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "public", "data", "events")
+
+# Shared with PRESET_INSTRUMENTS in packages/astro-utils/src/constants.js
+PRESETS_FILE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "..", "..", "packages", "astro-utils", "src", "presetInstruments.json",
+)
+with open(PRESETS_FILE, encoding="utf-8") as f:
+    PRESET_INSTRUMENTS = json.load(f)
+
+
+def natal_chart_payload(fa, preset):
+    """Natal chart of `fa` as a JSON-ready dict."""
+    points = {}
+    for name, lon in fa.all_natal_points.items():
+        points[name] = {
+            "longitude": round(lon, 4),
+            "sign":      SIGNS[int(lon // 30)],
+            "degree":    round(lon % 30, 2),
+        }
+    return {
+        "name":          fa.instrument_name,
+        "description":   preset.get("description", ""),
+        "birthDate":     preset["birthDate"],
+        "birthTime":     preset["birthTime"],
+        "birthLocation": preset["birthLocation"],
+        "lat":           preset["lat"],
+        "lon":           preset["lon"],
+        "utcOffset":     preset["utcOffset"],
+        "rulingPlanet":  fa.ruling_planet_name,
+        "houseSystem":   HOUSE_SYSTEMS[fa.house_system],
+        "houses":        [round(c, 4) for c in fa._houses],
+        "points":        points,
+    }
+
+
+def _overlaps_year(start, end, year):
+    """True when the 'YYYY/MM/DD' span start..end touches `year`."""
+    return int(start[:4]) <= year <= int(end[:4])
+
+
+def build_instrument_bundles(name, preset, start_year, end_year,
+                             orb_days=2, top_n=3, transit_planets=None, natal_points=None):
+    """
+    Compute one instrument over the whole range and split it by year.
+    Returns (natal_chart, {year: payload}).
+    """
+    fa = FinancialAstrology(
+        instrument_name = name,
+        birth_date      = preset["birthDate"].replace("-", "/"),
+        birth_time      = preset["birthTime"],
+        birth_location  = preset["birthLocation"],
+        lat             = preset["lat"],
+        lon             = preset["lon"],
+        utc_offset      = preset["utcOffset"],
+    )
+    start_date = f"{start_year}/01/01"
+    end_date   = f"{end_year}/12/31"
+
+    # One pass over the full range, so windows crossing a year boundary stay whole
+    events = fa.calculate_transits(
+        start_date          = start_date,
+        end_date            = end_date,
+        orb_days            = orb_days,
+        transit_planets     = transit_planets,
+        natal_points_filter = natal_points,
+    )
+    rx_days = fa.find_retrograde_days("Mercury", start_date, end_date)
+    _, aspect_windows, retro_windows, _ = fa.prepare_outputs(
+        events, rx_days, max_orb=orb_days, top_n=top_n
+    )
+
+    years = {}
+    for year in range(start_year, end_year + 1):
+        years[year] = {
+            "version":       BUNDLE_VERSION,
+            "instrument":    name,
+            "year":          year,
+            "events":        [
+                {k: v for k, v in e.items() if k != "DateObj"}
+                for e in events if int(e["Date"][:4]) == year
+            ],
+            "aspectWindows": [w for w in aspect_windows if _overlaps_year(w["Start"], w["End"], year)],
+            "retroWindows":  [w for w in retro_windows if _overlaps_year(w["start"], w["end"], year)],
+        }
+    return natal_chart_payload(fa, preset), years
+
+
+def write_chunk(out_dir, rel_base, payload):
+    """
+    Write `payload` as `<rel_base>.json.gz` under out_dir.
+    Returns the manifest entry for the chunk.
+    """
+    raw = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    path = os.path.join(out_dir, rel_base)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    # mtime=0 keeps the output byte-identical between runs
+    blob = gzip.compress(raw, compresslevel=9, mtime=0)
+    with open(f"{path}.json.gz", "wb") as f:
+        f.write(blob)
+    return {
+        "bytes":   len(raw),
+        "events":  len(payload["events"]),
+        "gz":      f"{rel_base}.json.gz".replace(os.sep, "/"),
+        "gzBytes": len(blob),
+    }
+
+
+def generate(out_dir=EVENTS_DIR, instruments=None, start_year=2020, end_year=2030,
+             orb_days=2, top_n=3, transit_planets=None, natal_points=None):
+    """Generate every instrument's yearly chunks and the manifest. Returns the manifest."""
+    if start_year > end_year:
+        raise ValueError("Start year must be on or before end year.")
+
+    instruments = instruments or list(PRESET_INSTRUMENTS)
+    unknown = [i for i in instruments if i not in PRESET_INSTRUMENTS]
+    if unknown:
+        raise ValueError(f"Unknown preset instruments: {', '.join(unknown)}")
+    transit_planets = transit_planets or ["Sun", "Moon"]
+
+    manifest = {
+        "version":   BUNDLE_VERSION,
+        "generated": datetime.datetime.now(datetime.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "params": {
+            "startYear":      start_year,
+            "endYear":        end_year,
+            "orbDays":        orb_days,
+            "topN":           top_n,
+            "transitPlanets": transit_planets,
+            "natalPoints":    natal_points,
+        },
+        "instruments": {},
+    }
+    for name in instruments:
+        natal, years = build_instrument_bundles(
+            name, PRESET_INSTRUMENTS[name], start_year, end_year,
+            orb_days=orb_days, top_n=top_n,
+            transit_planets=transit_planets, natal_points=natal_points,
+        )
+        chunks = {
+            str(year): write_chunk(out_dir, os.path.join(name, str(year)), payload)
+            for year, payload in years.items()
+        }
+        manifest["instruments"][name] = {"natal": natal, "years": chunks}
+        logger.info(f"{name}: {sum(c['events'] for c in chunks.values())} events in {len(chunks)} yearly chunks")
+
+    os.makedirs(out_dir, exist_ok=True)
+    tmp = os.path.join(out_dir, f"manifest.json.{os.getpid()}.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(tmp, os.path.join(out_dir, "manifest.json"))
+    return manifest
+
+
+def main():
+    this_year = datetime.date.today().year
+    parser = argparse.ArgumentParser(
+        description="Precompute compressed, year-split JSON event bundles for the natal-events app."
+    )
+    parser.add_argument("--out-dir",     default=EVENTS_DIR, help="Output directory for manifest.json and chunks")
+    parser.add_argument("--instruments", nargs="*", default=None,
+                        help=f"Preset instruments (default: all of {', '.join(PRESET_INSTRUMENTS)})")
+    parser.add_argument("--start-year",  type=int, default=this_year - 5, help="First year to generate")
+    parser.add_argument("--end-year",    type=int, default=this_year + 5, help="Last year to generate")
+    parser.add_argument("--orb-days",    type=int, default=2, help="Orb window in degrees/days")
+    parser.add_argument("--top-n",       type=int, default=3, help="How many hits per date to keep for windows")
+    parser.add_argument("--transit-planets", nargs="*", default=["Sun","Moon"],
+                        help="Transiting planets (e.g., Sun Moon)")
+    parser.add_argument("--filter", nargs="*", default=None, help="Natal points to include (default: all)")
+    parser.add_argument("--verbose",     action="store_true", help="Enable verbose logging")
+
+    args = parser.parse_args()
+
+    logger.setLevel(logging.DEBUG if args.verbose else logging.INFO)
+
+    try:
+        manifest = generate(
+            out_dir         = args.out_dir,
+            instruments     = args.instruments,
+            start_year      = args.start_year,
+            end_year        = args.end_year,
+            orb_days        = args.orb_days,
+            top_n           = args.top_n,
+            transit_planets = args.transit_planets,
+            natal_points    = args.filter,
+        )
+        total = sum(
+            c["gzBytes"] for inst in manifest["instruments"].values() for c in inst["years"].values()
+        )
+        print(f"Wrote {len(manifest['instruments'])} instruments to {args.out_dir} ({total/1024:.1f} KiB gzipped)")
+    except (ValueError, FileNotFoundError) as e:
+        logger.error(e)
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,379 @@
+"""
+This script is the accuracy-vs-speed reference harness for fast computation paths.
+It freezes golden outputs of the current scalar implementation of `analyze_natal.py`
+(`calculate_transits`, `find_retrograde_days` and the window functions) over a corpus
+of instruments and date ranges, then diffs any new implementation against them with
+explicit tolerances and reports the speedup next to each diff:
+- window boundaries, retrograde days and significance scores must match exactly,
+- orbs may differ by at most --orb-tol degrees.
+
+The golden set is committed in `golden/` next to this script, one compressed file per
+case. It is frozen with swisseph's built-in Moshier ephemeris, so any checkout can check
+against it without ephemeris files or downloads; `freeze` refuses to overwrite it unless
+--force is given. With --ephe-dir the harness instead uses only the local ephemeris files
+in that directory and never downloads them. The ephemeris (swisseph version or file
+checksums) is stored with the golden outputs, so a golden set is only compared against
+the ephemeris it was frozen with.
+
+A candidate is any function `module:function` with the signature of `reference_outputs`
+below, returning a dict with the keys 'events', 'retro_days', 'aspect_windows' and
+'retro_windows'. A missing output fails the case; a candidate that only implements some
+of them is checked with --outputs.
+
+Usage:
+python reference_harness.py check --candidate fast_transits:compute_outputs --orb-tol 0.01
+python reference_harness.py check --candidate fast_transits:compute_events --outputs events
+python reference_harness.py --ephe-dir data/ephe --golden-dir data/golden freeze
+
+For more details, you can run the help command:
+python reference_harness.py --help
+"""
+
+import argparse
+import gzip
+import hashlib
+import importlib
+import itertools
+import json
+import os
+import re
+import sys
+import time
+import logging
+
+import swisseph as swe
+
+import analyze_natal
+from analyze_natal import (
+    FinancialAstrology, MOON_FILES, REQUIRED_FILES, ephemeris_files_for_range, logger,
+)
+
+GOLDEN_DIR      = os.path.join(os.path.dirname(os.path.abspath(__file__)), "golden")
+MOSHIER         = "moshier"  # --ephe-dir value for swisseph's built-in ephemeris
+OUTPUTS         = ("events", "retro_days", "aspect_windows", "retro_windows")
+DEFAULT_ORB_TOL = 0.01
+MAX_EXAMPLES    = 5  # mismatches printed per output and case
+
+# Shared with PRESET_INSTRUMENTS in packages/astro-utils/src/constants.js
+PRESETS_FILE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "..", "..", "packages", "astro-utils", "src", "presetInstruments.json",
+)
+with open(PRESETS_FILE, encoding="utf-8") as f:
+    PRESET_INSTRUMENTS = json.load(f)
+
+# Corpus: instruments x date ranges x transit planet sets
+CORPUS_INSTRUMENTS = ["VNIndex", "BTC", "AAPL", "NVDA"]
+CORPUS_RANGES = [
+    ("2000/01/01", "2000/03/31"),
+    ("2013/12/01", "2014/02/28"),  # crosses a year boundary
+    ("2025/01/01", "2025/03/31"),
+]
+CORPUS_PLANET_SETS = [
+    ["Sun", "Moon"],
+    ["Sun", "Moon", "Mercury", "Venus", "Mars", "Jupiter", "Neptune"],
+]
+CORPUS_PARAMS = {"orb_days": 2, "top_n": 3, "natal_points": None}
+
+
+def corpus_cases():
+    """Every (instrument, range, planets) combination as a case dict with a stable id."""
+    cases = []
+    for inst, (start, end), planets in itertools.product(
+        CORPUS_INSTRUMENTS, CORPUS_RANGES, CORPUS_PLANET_SETS
+    ):
+        case_id = f"{inst}_{start.replace('/', '')}-{end.replace('/', '')}_{len(planets)}p"
+        cases.append({
+            "id":              case_id,
+            "instrument":      inst,
+            "start_date":      start,
+            "end_date":        end,
+            "transit_planets": planets,
+            **CORPUS_PARAMS,
+        })
+    return cases
+
+
+def use_local_ephemeris(ephe_dir):
+    """
+    Point the analysis at the bundled ephemeris files in `ephe_dir`, refusing to download.
+    Returns {file: sha256} of the files the corpus needs. With MOSHIER no files are used
+    and {"moshier": swisseph version} is returned.
+    """
+    if ephe_dir == MOSHIER:
+        # No ephemeris file can be found under os.devnull, so swisseph uses Moshier
+        analyze_natal.EPHE_DIR = os.devnull
+        FinancialAstrology._ephemeris_ready.update(REQUIRED_FILES + MOON_FILES)
+        return {MOSHIER: swe.version}
+
+    years = [int(d[:4]) for rng in CORPUS_RANGES for d in rng]
+    years += [int(PRESET_INSTRUMENTS[i]["birthDate"][:4]) for i in CORPUS_INSTRUMENTS]
+    needed = ephemeris_files_for_range(min(years), max(years))
+    missing = [f for f in needed
+               if not os.path.exists(os.path.join(ephe_dir, f))
+               or os.path.getsize(os.path.join(ephe_dir, f)) == 0]
+    if missing:
+        raise FileNotFoundError(
+            f"Local ephemeris files missing in {ephe_dir}: {', '.join(missing)}"
+        )
+    analyze_natal.EPHE_DIR = ephe_dir
+    # Any file still to be verified is "fetched" from the same local directory
+    FinancialAstrology.ephemeris_source = ephe_dir
+
+    checksums = {}
+    for fname in needed:
+        with open(os.path.join(ephe_dir, fname), "rb") as f:
+            checksums[fname] = hashlib.sha256(f.read()).hexdigest()
+    return checksums
+
+
+def build_instrument(case):
+    preset = PRESET_INSTRUMENTS[case["instrument"]]
+    return FinancialAstrology(
+        instrument_name = case["instrument"],
+        birth_date      = preset["birthDate"].replace("-", "/"),
+        birth_time      = preset["birthTime"],
+        birth_location  = preset["birthLocation"],
+        lat             = preset["lat"],
+        lon             = preset["lon"],
+        utc_offset      = preset["utcOffset"],
+    )
+
+
+def reference_outputs(fa, start_date, end_date, orb_days, transit_planets, natal_points, top_n):
+    """The current scalar implementation, exactly as the CLI runs it."""
+    events = fa.calculate_transits(
+        start_date          = start_date,
+        end_date            = end_date,
+        orb_days            = orb_days,
+        transit_planets     = transit_planets,
+        natal_points_filter = natal_points,
+    )
+    retro_days = fa.find_retrograde_days("Mercury", start_date, end_date)
+    _, aspect_windows, retro_windows, _ = fa.prepare_outputs(
+        events, retro_days, max_orb=orb_days, top_n=top_n
+    )
+    return {
+        "events":         [{k: v for k, v in e.items() if k != "DateObj"} for e in events],
+        "retro_days":     retro_days,
+        "aspect_windows": aspect_windows,
+        "retro_windows":  retro_windows,
+    }
+
+
+def run_case(impl, case):
+    """Run `impl` on one case. Returns (outputs, seconds)."""
+    fa = build_instrument(case)
+    t0 = time.perf_counter()
+    outputs = impl(
+        fa,
+        start_date      = case["start_date"],
+        end_date        = case["end_date"],
+        orb_days        = case["orb_days"],
+        transit_planets = case["transit_planets"],
+        natal_points    = case["natal_points"],
+        top_n           = case["top_n"],
+    )
+    return outputs, time.perf_counter() - t0
+
+
+def _strip_orbs(text):
+    return re.sub(r"Orb -?[\d.]+°", "Orb °", text)
+
+
+def _diff_records(golden, candidate, key_fields, orb_fields, orb_tol, text_fields=()):
+    """
+    Diff two lists of dicts matched on `key_fields`.
+    Fields in `orb_fields` may differ by `orb_tol`, fields in `text_fields` are compared
+    with orb values stripped, every other field must match exactly.
+    Returns (mismatch messages, max orb error).
+    """
+    def index(records):
+        out = {}
+        for r in records:
+            out[tuple(r.get(k) for k in key_fields)] = r
+        return out
+
+    gold, cand = index(golden), index(candidate)
+    problems, max_err = [], 0.0
+
+    for key in sorted(set(gold) - set(cand), key=str):
+        problems.append(f"missing {key}")
+    for key in sorted(set(cand) - set(gold), key=str):
+        problems.append(f"unexpected {key}")
+
+    for key in sorted(set(gold) & set(cand), key=str):
+        g, c = gold[key], cand[key]
+        for field in sorted(set(g) | set(c)):
+            gv, cv = g.get(field), c.get(field)
+            if field in orb_fields:
+                if gv is None or cv is None:
+                    if gv != cv:
+                        problems.append(f"{key} {field}: {gv} != {cv}")
+                    continue
+                err = abs(float(gv) - float(cv))
+                max_err = max(max_err, err)
+                if err > orb_tol + 1e-9:
+                    problems.append(f"{key} {field}: |{gv} - {cv}| = {err:.4f} > {orb_tol}")
+            elif field in text_fields:
+                if _strip_orbs(str(gv)) != _strip_orbs(str(cv)):
+                    problems.append(f"{key} {field}: {gv!r} != {cv!r}")
+            elif gv != cv:
+                problems.append(f"{key} {field}: {gv!r} != {cv!r}")
+    return problems, max_err
+
+
+def diff_outputs(golden, candidate, orb_tol=DEFAULT_ORB_TOL, outputs=OUTPUTS):
+    """
+    Compare the candidate's `outputs` against the golden ones; an output the candidate
+    doesn't return is a problem. Returns {output: {"problems": [...], "max_orb_error": x}}.
+    """
+    report = {
+        name: {"problems": ["not returned by the candidate"], "max_orb_error": 0.0}
+        for name in outputs if name not in candidate
+    }
+    candidate = {k: v for k, v in candidate.items() if k in outputs}
+    if "events" in candidate:
+        problems, err = _diff_records(
+            golden["events"], candidate["events"],
+            key_fields=("Date", "Natal Point"), orb_fields=("Orb Degree",),
+            orb_tol=orb_tol, text_fields=("Transits",),
+        )
+        report["events"] = {"problems": problems, "max_orb_error": err}
+    if "retro_days" in candidate:
+        gold, cand = set(golden["retro_days"]), set(candidate["retro_days"])
+        problems = [f"missing {d}" for d in sorted(gold - cand)]
+        problems += [f"unexpected {d}" for d in sorted(cand - gold)]
+        report["retro_days"] = {"problems": problems, "max_orb_error": 0.0}
+    if "aspect_windows" in candidate:
+        problems, err = _diff_records(
+            golden["aspect_windows"], candidate["aspect_windows"],
+            key_fields=("Label", "Start"), orb_fields=("PeakOrb",), orb_tol=orb_tol,
+        )
+        report["aspect_windows"] = {"problems": problems, "max_orb_error": err}
+    if "retro_windows" in candidate:
+        problems, _ = _diff_records(
+            golden["retro_windows"], candidate["retro_windows"],
+            key_fields=("start",), orb_fields=(), orb_tol=orb_tol,
+        )
+        report["retro_windows"] = {"problems": problems, "max_orb_error": 0.0}
+    return report
+
+
+def _golden_path(golden_dir, case):
+    return os.path.join(golden_dir, f"{case['id']}.json.gz")
+
+
+def freeze(golden_dir=GOLDEN_DIR, ephe_dir=MOSHIER, force=False):
+    """
+    Compute and store golden outputs of the reference implementation for the whole corpus.
+    Existing golden outputs are only replaced with `force`.
+    """
+    existing = [c["id"] for c in corpus_cases() if os.path.exists(_golden_path(golden_dir, c))]
+    if existing and not force:
+        raise ValueError(
+            f"Golden outputs already exist in {golden_dir} ({len(existing)} cases). They are the "
+            f"reference every candidate is checked against; use --force to re-freeze them."
+        )
+    checksums = use_local_ephemeris(ephe_dir)
+    os.makedirs(golden_dir, exist_ok=True)
+    for case in corpus_cases():
+        outputs, seconds = run_case(reference_outputs, case)
+        raw = json.dumps({"case": case, "ephemeris": checksums, "outputs": outputs},
+                         ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        # mtime=0 keeps re-freezing an unchanged implementation byte-identical
+        with open(_golden_path(golden_dir, case), "wb") as f:
+            f.write(gzip.compress(raw, compresslevel=9, mtime=0))
+        print(f"  froze {case['id']}: {len(outputs['events'])} events, "
+              f"{len(outputs['aspect_windows'])} windows ({seconds:.2f}s)")
+
+
+def check(candidate, golden_dir=GOLDEN_DIR, ephe_dir=MOSHIER, orb_tol=DEFAULT_ORB_TOL,
+          outputs=OUTPUTS):
+    """
+    Diff `outputs` of `candidate` against every golden case and print a report with the
+    speedup over the reference implementation (both timed in this run). Returns True if all pass.
+    """
+    checksums = use_local_ephemeris(ephe_dir)
+    all_ok = True
+    total_ref = total_cand = 0.0
+
+    print(f"{'case':<40} {'status':<6} {'ref s':>8} {'cand s':>8} {'speedup':>8} {'max orb err':>12}")
+    for case in corpus_cases():
+        path = _golden_path(golden_dir, case)
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Golden output missing: {path}. Run 'freeze' first.")
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            golden = json.load(f)
+        if golden["ephemeris"] != checksums:
+            raise ValueError(f"Ephemeris files differ from those {case['id']} was frozen with; re-run 'freeze'.")
+
+        _, ref_s = run_case(reference_outputs, case)
+        cand_outputs, cand_s = run_case(candidate, case)
+        total_ref += ref_s
+        total_cand += cand_s
+
+        report = diff_outputs(golden["outputs"], cand_outputs, orb_tol, outputs)
+        ok = all(not r["problems"] for r in report.values())
+        all_ok &= ok
+        max_err = max((r["max_orb_error"] for r in report.values()), default=0.0)
+        print(f"{case['id']:<40} {'PASS' if ok else 'FAIL':<6} {ref_s:>8.3f} {cand_s:>8.3f} "
+              f"{ref_s / cand_s if cand_s else float('inf'):>7.1f}x {max_err:>12.4f}")
+        for name, r in report.items():
+            for problem in r["problems"][:MAX_EXAMPLES]:
+                print(f"    {name}: {problem}")
+            if len(r["problems"]) > MAX_EXAMPLES:
+                print(f"    {name}: ... {len(r['problems']) - MAX_EXAMPLES} more")
+
+    print(f"\nTOTAL {'PASS' if all_ok else 'FAIL'}: reference {total_ref:.2f}s, candidate {total_cand:.2f}s, "
+          f"speedup {total_ref / total_cand if total_cand else float('inf'):.1f}x")
+    return all_ok
+
+
+def load_candidate(spec):
+    """Resolve a 'module:function' spec; 'reference' is the scalar implementation itself."""
+    if spec == "reference":
+        return reference_outputs
+    module_name, _, func_name = spec.partition(":")
+    if not func_name:
+        raise ValueError(f"Invalid candidate: '{spec}'. Use 'module:function'.")
+    return getattr(importlib.import_module(module_name), func_name)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Freeze golden outputs of the scalar implementation and diff fast paths against them."
+    )
+    parser.add_argument("--golden-dir", default=GOLDEN_DIR, help="Directory of golden output files")
+    parser.add_argument("--ephe-dir",   default=MOSHIER,
+                        help="Local ephemeris directory, or 'moshier' for the built-in ephemeris (default)")
+    parser.add_argument("--verbose",    action="store_true", help="Enable verbose logging")
+    sub = parser.add_subparsers(dest="command", required=True)
+    freeze_parser = sub.add_parser("freeze", help="Freeze golden outputs from the current implementation")
+    freeze_parser.add_argument("--force", action="store_true", help="Overwrite existing golden outputs")
+    check_parser = sub.add_parser("check", help="Diff a candidate implementation against the golden outputs")
+    check_parser.add_argument("--candidate", default="reference",
+                              help="Implementation as 'module:function' (default: the reference itself)")
+    check_parser.add_argument("--orb-tol", type=float, default=DEFAULT_ORB_TOL,
+                              help="Maximum allowed orb difference in degrees")
+    check_parser.add_argument("--outputs", nargs="*", choices=OUTPUTS, default=list(OUTPUTS),
+                              help="Outputs to compare, for candidates that only implement some (default: all)")
+
+    args = parser.parse_args()
+
+    if args.verbose:
+        logger.setLevel(logging.DEBUG)
+
+    try:
+        if args.command == "freeze":
+            freeze(args.golden_dir, args.ephe_dir, args.force)
+        else:
+            ok = check(load_candidate(args.candidate), args.golden_dir, args.ephe_dir,
+                       args.orb_tol, args.outputs)
+            sys.exit(0 if ok else 1)
+    except (ValueError, FileNotFoundError, ImportError, AttributeError) as e:
+        logger.error(e)
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
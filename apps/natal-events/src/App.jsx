@@ -11,6 +11,7 @@ import NatalPointsFilterSelector from './components/NatalPointsFilterSelector';
 import { Button, Card, Input, Label, Select, SelectContent, SelectItem, SelectTrigger, SelectValue, Separator, Switch } from '@embed-tools/components';
 import { NatalCalculator } from '@embed-tools/astro-utils';
 import iframeUtils from '@embed-tools/iframe-utils';
+import { loadBundledAnalysis } from './utils/eventBundles';
 
 const App = () => {
   const [loading, setLoading] = useState(false);
@@ -167,40 +168,64 @@ const App = () => {
       // Convert timezone name to UTC offset string
       const utcOffset = getUTCOffset(formData.timeZone.value);
      
-      const calculator = new NatalCalculator(
-        formData.instrument,
-        birthDateStr,
-        birthTimeStr,
-        formData.birthLocation,
-        formData.lat,
-        formData.lon,
-        utcOffset
-      );
-
-      // Calculate natal chart
-      const natal = calculator.getNatalChart();
-      setNatalChart(natal);
-
-      // Calculate transits
-      const results = calculator.calculateTransits(
-        formData.startDate,
-        formData.endDate,
-        formData.orbDays,
-        formData.transitPlanets,
-        formData.natalPointsFilter
-      );
-
-      // Prepare outputs
-      const outputs = calculator.prepareOutputs(
-        results.events,
-        results.retroDays,
-        180.0,
-        formData.topN
-      );
-
-      setEvents(outputs.events);
-      setRetroWindows(outputs.retroWindows);
-      setAspectWindows(outputs.aspectWindows);
+      // Preset instruments show the precomputed Swiss Ephemeris bundles when they cover the request
+      const bundled = await loadBundledAnalysis({
+        instrument: formData.instrument,
+        birthDate: birthDateStr,
+        birthTime: birthTimeStr,
+        lat: formData.lat,
+        lon: formData.lon,
+        startDate: formData.startDate,
+        endDate: formData.endDate,
+        orbDays: formData.orbDays,
+        transitPlanets: formData.transitPlanets,
+        natalPoints: formData.natalPointsFilter
+      }).catch(error => {
+        console.warn('Event bundles unavailable, calculating transits:', error.message);
+        return null;
+      });
+
+      if (bundled) {
+        setNatalChart(bundled.natalChart);
+        setEvents(bundled.events);
+        setRetroWindows(bundled.retroWindows);
+        setAspectWindows(bundled.aspectWindows);
+      } else {
+        const calculator = new NatalCalculator(
+          formData.instrument,
+          birthDateStr,
+          birthTimeStr,
+          formData.birthLocation,
+          formData.lat,
+          formData.lon,
+          utcOffset
+        );
+
+        // Calculate natal chart
+        const natal = calculator.getNatalChart();
+        setNatalChart(natal);
+
+        // Calculate transits
+        const results = calculator.calculateTransits(
+          formData.startDate,
+          formData.endDate,
+          formData.orbDays,
+          formData.transitPlanets,
+          formData.natalPointsFilter
+        );
+
+        // Prepare outputs
+        const outputs = calculator.prepareOutputs(
+          results.events,
+          results.retroDays,
+          180.0,
+          formData.topN
+        );
+
+        setEvents(outputs.events);
+        setRetroWindows(outputs.retroWindows);
+        setAspectWindows(outputs.aspectWindows);
+      }
       setFocusDate(new Date()); // Reset to current date
     } catch (error) {
       console.error('Analysis failed:', error);
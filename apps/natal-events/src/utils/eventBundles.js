@@ -0,0 +1,212 @@
+// Event bundle loader for natal-events
+// Lazy-loads the precomputed, year-split bundles written by generate_event_bundles.py
+
+import { ASPECTS } from '@embed-tools/astro-utils';
+
+const BUNDLE_ROOT = `${import.meta.env.BASE_URL}data/events/`;
+
+let manifestPromise = null;
+const chunkCache = new Map();
+
+/**
+ * Load the bundle manifest (natal charts, generation params and chunk index)
+ * @returns {Promise<Object>} Promise resolving to the manifest
+ */
+export function loadManifest() {
+  if (!manifestPromise) {
+    manifestPromise = fetch(`${BUNDLE_ROOT}manifest.json`)
+      .then(response => {
+        if (!response.ok) {
+          throw new Error(`Event bundle manifest not found (${response.status})`);
+        }
+        return response.json();
+      })
+      .catch(error => {
+        manifestPromise = null;
+        throw error;
+      });
+  }
+  return manifestPromise;
+}
+
+// Fetch a .json.gz chunk; hosts that already sent it with Content-Encoding are handled too
+async function fetchGzipJson(url) {
+  const response = await fetch(url);
+  if (!response.ok) {
+    throw new Error(`Event bundle chunk not found: ${url} (${response.status})`);
+  }
+  const buffer = await response.arrayBuffer();
+  const bytes = new Uint8Array(buffer);
+  if (bytes[0] !== 0x1f || bytes[1] !== 0x8b) {
+    return JSON.parse(new TextDecoder().decode(bytes));
+  }
+  const stream = new Blob([buffer]).stream().pipeThrough(new DecompressionStream('gzip'));
+  return new Response(stream).json();
+}
+
+/**
+ * Years touched by a date range
+ * @param {Date} startDate - Range start
+ * @param {Date} endDate - Range end
+ * @returns {number[]} Years from startDate to endDate inclusive
+ */
+export function yearsInRange(startDate, endDate) {
+  const years = [];
+  for (let y = startDate.getFullYear(); y <= endDate.getFullYear(); y++) {
+    years.push(y);
+  }
+  return years;
+}
+
+/**
+ * Load and merge the bundles of an instrument for the given years.
+ * Years outside the generated range are skipped; windows spanning
+ * several loaded years are returned once.
+ * @param {string} instrument - Preset instrument key (e.g. 'VNIndex')
+ * @param {number[]} years - Years to load
+ * @returns {Promise<Object>} Promise resolving to {natal, events, aspectWindows, retroWindows}
+ */
+export async function loadInstrumentYears(instrument, years) {
+  const manifest = await loadManifest();
+  const entry = manifest.instruments[instrument];
+  if (!entry) {
+    throw new Error(`No event bundles for instrument ${instrument}`);
+  }
+
+  const chunks = await Promise.all(
+    years
+      .filter(year => entry.years[year])
+      .map(year => {
+        const url = `${BUNDLE_ROOT}${entry.years[year].gz}`;
+        if (!chunkCache.has(url)) {
+          chunkCache.set(url, fetchGzipJson(url).catch(error => {
+            chunkCache.delete(url);
+            throw error;
+          }));
+        }
+        return chunkCache.get(url);
+      })
+  );
+
+  const dedupe = (windows, keyOf) => {
+    const seen = new Map();
+    windows.forEach(w => seen.set(keyOf(w), w));
+    return [...seen.values()];
+  };
+
+  return {
+    natal: entry.natal,
+    events: chunks.flatMap(c => c.events),
+    aspectWindows: dedupe(chunks.flatMap(c => c.aspectWindows), w => `${w.Label}|${w.Start}`),
+    retroWindows: dedupe(chunks.flatMap(c => c.retroWindows), w => w.start),
+  };
+}
+
+// 'YYYY/MM/DD' bundle dates at noon UT, like the daily transit samples
+function parseBundleDate(str) {
+  const [y, m, d] = str.split('/').map(Number);
+  return new Date(Date.UTC(y, m - 1, d, 12));
+}
+
+/**
+ * Analysis of a preset instrument straight from the bundles: the Swiss Ephemeris natal
+ * chart, scored events, aspect windows and Mercury retrograde windows, in the shapes the
+ * app renders. Each event is one of Python's aggregated records (all transits hitting a
+ * natal point that day, with their combined score), so its title lists every transit.
+ * Resolves to null when the bundles don't cover the request (other birth data, transit
+ * planets or orb, natal points that were not bundled, or years that were not generated),
+ * so the caller can compute it instead.
+ * @param {Object} request - {instrument, birthDate, birthTime, lat, lon, startDate,
+ *   endDate, orbDays, transitPlanets, natalPoints}
+ * @returns {Promise<Object|null>} Promise resolving to
+ *   {natalChart, events, aspectWindows, retroWindows} or null
+ */
+export async function loadBundledAnalysis(request) {
+  const manifest = await loadManifest();
+  const entry = manifest.instruments[request.instrument];
+  if (!entry) return null;
+
+  const { natal } = entry;
+  const { params } = manifest;
+  // Events are scored per natal point over all transit planets, so those must match exactly
+  const samePlanets = params.transitPlanets.length === request.transitPlanets.length
+    && request.transitPlanets.every(p => params.transitPlanets.includes(p));
+  const bundledPoints = Object.keys(natal.points)
+    .filter(p => !params.natalPoints || params.natalPoints.includes(p));
+  const coversPoints = request.natalPoints.every(p => bundledPoints.includes(p));
+  if (natal.birthDate !== request.birthDate || natal.birthTime !== request.birthTime
+    || natal.lat !== request.lat || natal.lon !== request.lon
+    || params.orbDays !== request.orbDays || !samePlanets || !coversPoints) {
+    return null;
+  }
+
+  const years = yearsInRange(request.startDate, request.endDate);
+  if (!years.every(year => entry.years[year])) return null;
+  const bundle = await loadInstrumentYears(request.instrument, years);
+
+  const from = new Date(request.startDate);
+  from.setHours(0, 0, 0, 0);
+  const to = new Date(request.endDate);
+  to.setHours(23, 59, 59, 999);
+  const overlaps = (start, end) => end >= from && start <= to;
+  const wanted = p => request.natalPoints.includes(p);
+
+  const events = bundle.events
+    .filter(e => wanted(e['Natal Point']))
+    .map(e => {
+      const date = parseBundleDate(e.Date);
+      const np = e['Natal Point'];
+      const score = e['Significance Score'];
+      // The tightest transit gives the aspect (colour, interpretation); the title lists them all
+      const aspect = {
+        ...(ASPECTS.find(a => a.name === e.Aspect) || { name: e.Aspect }),
+        interpretation: e.Interpretation,
+        deviation: e['Orb Degree'],
+      };
+      return {
+        date,
+        startDate: date,
+        endDate: date,
+        transitPlanet: e['Transit Planet'],
+        natalPoint: np,
+        aspect,
+        score,
+        transits: e.Transits,
+        type: 'transit',
+        title: `${e.Transits} → ${np}`,
+        description: `${e.Interpretation} Score: ${score.toFixed(1)}`
+      };
+    })
+    .filter(e => overlaps(e.date, e.date))
+    .sort((a, b) => a.date - b.date);
+
+  const aspectWindows = bundle.aspectWindows
+    .filter(w => wanted(w['Natal Point']))
+    .map(w => ({
+      planet1: w['Transit Planet'],
+      planet2: w['Natal Point'],
+      aspect: w.Aspect,
+      startDate: parseBundleDate(w.Start),
+      endDate: parseBundleDate(w.End),
+      peakDate: parseBundleDate(w.Peak),
+      peakDeviation: w.PeakOrb,
+      score: w.Score,
+    }))
+    .filter(w => overlaps(w.startDate, w.endDate));
+
+  // Bundled retrograde windows are Mercury's; shown like the calculated ones, only when selected
+  const retroWindows = !request.transitPlanets.includes('Mercury') ? [] : bundle.retroWindows
+    .map(w => {
+      const startDate = parseBundleDate(w.start);
+      const endDate = parseBundleDate(w.end);
+      return {
+        planet: 'Mercury',
+        startDate,
+        endDate,
+        days: Math.round((endDate - startDate) / 86400000) + 1,
+      };
+    })
+    .filter(w => overlaps(w.startDate, w.endDate));
+
+  return { natalChart: natal.points, events, aspectWindows, retroWindows };
+}
@@ -1,5 +1,7 @@
 // Astrological constants and definitions
 
+import presetInstruments from './presetInstruments.json' with { type: 'json' };
+
 // Aspect definitions with orbs and polarities based on astrological methodology
 export const ASPECTS = [
   { angle: 0, name: "Conjunction (0°)", orb: 10, interpretation: "New cycle, release of energy. Good.", polarity: 0.8 },
@@ -41,88 +43,8 @@ export const RULING_PLANET_BONUS = 2.5;
 export const RETROGRADE_BONUS = 1.0;
 
 // Preset instruments with their natal data
-export const PRESET_INSTRUMENTS = {
-  "VNIndex": {
-    name: "VNIndex",
-    birthDate: "2000-07-28",
-    birthTime: "09:00",
-    birthLocation: "Ho Chi Minh City",
-    lat: "10.7769N",
-    lon: "106.7009E",
-    utcOffset: "+07:00",
-    description: "Vietnam Stock Market Index"
-  },
-  "BTC": {
-    name: "BTC",
-    birthDate: "2009-01-03",
-    birthTime: "18:15",
-    birthLocation: "Unknown",
-    lat: "0.0000N",
-    lon: "0.0000E",
-    utcOffset: "+00:00",
-    description: "Bitcoin - First block mined"
-  },
-  "AAPL": {
-    name: "AAPL",
-    birthDate: "1976-04-01",
-    birthTime: "09:00",
-    birthLocation: "Cupertino, CA",
-    lat: "37.3230N",
-    lon: "122.0322W",
-    utcOffset: "-08:00",
-    description: "Apple Inc. - Founded"
-  },
-  "TSLA": {
-    name: "TSLA",
-    birthDate: "2003-07-01",
-    birthTime: "09:00",
-    birthLocation: "Palo Alto, CA",
-    lat: "37.4419N",
-    lon: "122.1430W",
-    utcOffset: "-08:00",
-    description: "Tesla Inc. - Founded"
-  },
-  "GOOGL": {
-    name: "GOOGL",
-    birthDate: "2004-08-19",
-    birthTime: "09:00",
-    birthLocation: "Mountain View, CA",
-    lat: "37.4219N",
-    lon: "122.0841W",
-    utcOffset: "-08:00",
-    description: "Google Inc. - IPO"
-  },
-  "MSFT": {
-    name: "MSFT",
-    birthDate: "1986-03-13",
-    birthTime: "09:00",
-    birthLocation: "Redmond, WA",
-    lat: "47.6740N",
-    lon: "122.1215W",
-    utcOffset: "-08:00",
-    description: "Microsoft Corp. - IPO"
-  },
-  "AMZN": {
-    name: "AMZN",
-    birthDate: "1997-05-15",
-    birthTime: "09:00",
-    birthLocation: "Seattle, WA",
-    lat: "47.6062N",
-    lon: "122.3321W",
-    utcOffset: "-08:00",
-    description: "Amazon.com Inc. - IPO"
-  },
-  "NVDA": {
-    name: "NVDA",
-    birthDate: "1999-01-22",
-    birthTime: "09:00",
-    birthLocation: "Santa Clara, CA",
-    lat: "37.3541N",
-    lon: "121.9552W",
-    utcOffset: "-08:00",
-    description: "NVIDIA Corp. - IPO"
-  }
-};
+// Shared with the Python scripts in apps/natal-events, so they are kept as JSON
+export const PRESET_INSTRUMENTS = presetInstruments;
 
 // Vietnam locations for quick lookup
 export const VIETNAM_LOCATIONS = {